@@ -1,10 +1,16 @@
-from fastapi import FastAPI, APIRouter, HTTPException, BackgroundTasks
+from fastapi import FastAPI, APIRouter, HTTPException, BackgroundTasks, Depends
 from fastapi.responses import StreamingResponse
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 import os
 import logging
+import logging.handlers
+import queue
+import atexit
+import heapq
+import io
 import json
+import operator
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional, Dict, Any, Tuple
@@ -12,22 +18,142 @@ import uuid
 from datetime import datetime, timezone
 import asyncio
 import requests
+import httpx
 from google import genai
 from google.genai import types
 import re
-from urllib.parse import urlparse, quote
+from urllib.parse import urlparse, urlsplit, urlunsplit, quote
 from bs4 import BeautifulSoup
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 import functools
+import itertools
+from contextlib import asynccontextmanager
+import sqlite3
 import hashlib
-from collections import OrderedDict
+from collections import OrderedDict, defaultdict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 on the async client when present
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-# In-memory storage for audits
-audits_store: Dict[str, Dict[str, Any]] = {}
+
+def _json_loads(data) -> Any:
+    """Parse JSON with orjson (C parser) when available, stdlib otherwise"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode('utf-8')
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> str:
+    """Serialize JSON with orjson when available, stdlib otherwise"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+class AuditStore:
+    """Audit store with dict-speed reads and write-through SQLite persistence.
+    
+    The in-memory dict keeps the polling/SSE endpoints as fast as before,
+    while terminal states (completed/failed) survive process restarts.
+    Progress ticks are memory-only so a running audit never touches disk.
+    Multi-worker deployments can point AUDIT_DB_PATH at shared storage.
+    """
+    
+    def __init__(self, db_path: Path, max_size: int = 200):
+        self._audits: Dict[str, Dict[str, Any]] = {}
+        self._db_path = db_path
+        self._max_size = max_size
+        self._enabled = True
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS audits (id TEXT PRIMARY KEY, doc TEXT NOT NULL)"
+                )
+                loaded = [(audit_id, _json_loads(doc))
+                          for audit_id, doc in conn.execute("SELECT id, doc FROM audits")]
+            # Oldest first, so dict insertion order matches creation order
+            # and eviction below always drops the oldest audit
+            loaded.sort(key=lambda item: item[1].get('created_at', ''))
+            for audit_id, doc in loaded:
+                # Audits interrupted by a restart can never finish; mark
+                # them failed so clients don't poll them forever
+                if doc.get('status') not in ('completed', 'failed'):
+                    doc['status'] = 'failed'
+                    doc['progress_message'] = 'Interrupted by server restart'
+                    self._audits[audit_id] = doc
+                    self._persist(audit_id)
+                else:
+                    self._audits[audit_id] = doc
+            self._evict_over_limit()
+        except Exception as e:
+            logger.warning(f"Audit persistence disabled ({e}); falling back to memory only")
+            self._enabled = False
+    
+    def _evict_over_limit(self):
+        while len(self._audits) > self._max_size:
+            oldest = next(iter(self._audits))
+            del self[oldest]
+            audit_events.pop(oldest, None)
+    
+    def _connect(self):
+        return sqlite3.connect(self._db_path)
+    
+    def _persist(self, audit_id: str):
+        if not self._enabled:
+            return
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO audits (id, doc) VALUES (?, ?)",
+                    (audit_id, _json_dumps(self._audits[audit_id]))
+                )
+        except Exception as e:
+            logger.warning(f"Failed to persist audit {audit_id}: {e}")
+    
+    def __contains__(self, audit_id: str) -> bool:
+        return audit_id in self._audits
+    
+    def __getitem__(self, audit_id: str) -> Dict[str, Any]:
+        return self._audits[audit_id]
+    
+    def __setitem__(self, audit_id: str, doc: Dict[str, Any]):
+        self._audits[audit_id] = doc
+        self._persist(audit_id)
+        self._evict_over_limit()
+    
+    def __delitem__(self, audit_id: str):
+        del self._audits[audit_id]
+        if self._enabled:
+            try:
+                with self._connect() as conn:
+                    conn.execute("DELETE FROM audits WHERE id = ?", (audit_id,))
+            except Exception as e:
+                logger.warning(f"Failed to delete persisted audit {audit_id}: {e}")
+    
+    def get(self, audit_id: str, default=None):
+        return self._audits.get(audit_id, default)
+    
+    def values(self):
+        return self._audits.values()
+    
+    def update(self, audit_id: str, fields: Dict[str, Any], persist: bool = True):
+        """Merge fields into an audit; persist=False skips disk for progress ticks"""
+        self._audits[audit_id].update(fields)
+        if persist:
+            self._persist(audit_id)
+
 
 # ============ Intelligent Cache System ============
 
@@ -66,9 +192,101 @@ class LRUCache:
         """Clear all cache"""
         self.cache.clear()
 
+class PersistentCache:
+    """Disk-backed cache with TTL so search results survive process restarts.
+
+    Entries are stored as one JSON file per key under cache_dir; keys are the
+    SHA1 of a whitespace-normalized query so trivially different spellings of
+    the same query still hit.
+    """
+    def __init__(self, cache_dir: Path, ttl_seconds: int = 86400):
+        self.cache_dir = cache_dir
+        self.ttl = ttl_seconds
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self.enabled = True
+        except OSError as e:
+            logging.warning(f"Persistent cache disabled ({cache_dir}): {e}")
+            self.enabled = False
+
+    @staticmethod
+    def _get_key(*args) -> str:
+        """Generate cache key from normalized arguments"""
+        normalized = [' '.join(a.split()) if isinstance(a, str) else a for a in args]
+        return hashlib.sha1(json.dumps(normalized, sort_keys=True).encode()).hexdigest()
+
+    def _path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get item from disk if present and not expired"""
+        if not self.enabled:
+            return None
+        path = self._path_for(key)
+        try:
+            if not path.exists():
+                return None
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink(missing_ok=True)
+                return None
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+
+    def set(self, key: str, value: Any):
+        """Write item to disk; failures only cost the cache, never the caller"""
+        if not self.enabled:
+            return
+        path = self._path_for(key)
+        try:
+            tmp_path = path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(value, f)
+            tmp_path.replace(path)
+        except (OSError, TypeError) as e:
+            logging.debug(f"Persistent cache write failed for {key}: {e}")
+
+
+class AsyncRateLimiter:
+    """Token-bucket limiter that paces outbound API calls.
+    
+    async with limiter: ... delays just enough to keep the call rate at or
+    under `rate` per `per` seconds, instead of sprinkling fixed sleeps
+    between requests.
+    """
+    
+    def __init__(self, rate: float, per: float = 1.0):
+        self._interval = per / rate
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+    
+    async def __aenter__(self):
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            wait = self._next_at - now
+            if wait > 0:
+                await asyncio.sleep(wait)
+                now = self._next_at
+            self._next_at = max(now, self._next_at) + self._interval
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
 # Global caches
 search_cache = LRUCache(max_size=1000, ttl_seconds=7200)  # 2 hours for search results
 content_cache = LRUCache(max_size=200, ttl_seconds=14400)  # 4 hours for fetched content
+html_cache = LRUCache(max_size=100, ttl_seconds=3600)  # 1 hour for raw disclosure-page HTML
+serper_disk_cache = PersistentCache(
+    Path(os.environ.get('SERPER_CACHE_DIR', str(ROOT_DIR / 'serper_cache'))),
+    ttl_seconds=7 * 86400  # 7 days - repeat runs and retries skip paid API calls
+)
+page_disk_cache = PersistentCache(
+    Path(os.environ.get('PAGE_CACHE_DIR', str(ROOT_DIR / 'page_cache'))),
+    ttl_seconds=86400  # 24 hours - official pages change slowly
+)
 
 # ============ KPI Schema with Search Keywords ============
 
@@ -386,8 +604,47 @@ KPI_SCHEMA = {
     }
 }
 
+# Hosts every audit hits; warming them at startup moves DNS + TLS setup
+# off the first request's critical path
+_WARMUP_URLS = (
+    "https://google.serper.dev/",
+    "https://en.wikipedia.org/",
+    "https://www.nirfindia.org/",
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    auditor = get_auditor()
+    client = auditor._get_http_client()
+    warmed = await asyncio.gather(
+        *[client.head(url, timeout=5) for url in _WARMUP_URLS],
+        return_exceptions=True
+    )
+    ok = sum(1 for r in warmed if not isinstance(r, BaseException))
+    logger.info(f"Warmed {ok}/{len(_WARMUP_URLS)} upstream connections")
+    yield
+    await auditor.aclose()
+
+
 # Create the main app
-app = FastAPI(title="College KPI Auditor API")
+if orjson is not None:
+    from fastapi.responses import ORJSONResponse
+    app = FastAPI(title="College KPI Auditor API", default_response_class=ORJSONResponse,
+                  lifespan=lifespan)
+else:
+    app = FastAPI(title="College KPI Auditor API", lifespan=lifespan)
+
+# CORS middleware, registered before any routes are included so it always
+# wraps them; origins parsed from the environment once at import
+_CORS_ORIGINS = [o.strip() for o in os.environ.get('CORS_ORIGINS', '*').split(',') if o.strip()]
+app.add_middleware(
+    CORSMiddleware,
+    allow_credentials=True,
+    allow_origins=_CORS_ORIGINS,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -397,8 +654,97 @@ logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+
+# Route records through an in-process queue so logger calls from async code
+# return after a lock-free put instead of blocking on stream I/O; a listener
+# thread owns the real handlers
+_log_queue: queue.Queue = queue.Queue(-1)
+_root_logger = logging.getLogger()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_root_logger.handlers, respect_handler_level=True
+)
+for _handler in list(_root_logger.handlers):
+    _root_logger.removeHandler(_handler)
+_root_logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
+
+def _load_kpis_from_schema() -> tuple:
+    """Transform the immutable KPI_SCHEMA into the auditor's KPI list once, at import time"""
+    kpis = []
+    for kpi_item in KPI_SCHEMA["college_kpis"]:
+        kpis.append({
+            'name': kpi_item['display_name'],
+            'field_name': kpi_item['field_name'],
+            'category': kpi_item['category'],
+            'data_type': kpi_item['data_type'],
+            'unit': kpi_item['unit'],
+            'validation_rules': kpi_item['validation_rules'],
+            'extraction_instruction': kpi_item['extraction_instruction'],
+            'remarks_required': kpi_item.get('remarks_required', False),
+            'search_keywords': kpi_item.get('search_keywords', []),
+        })
+    logger.info(f"Loaded {len(kpis)} KPIs from schema")
+    return tuple(kpis)
+
+
+KPIS_DATA = _load_kpis_from_schema()
+
+
+def _salvage_json_array(text: str):
+    r"""Recover the first valid JSON array embedded in malformed LLM output.
+    
+    Seeks each '[' and asks the decoder to parse from there - a guaranteed
+    linear scan, unlike the old r'\[[\s\S]*\]' regex which spanned first to
+    last bracket and could backtrack badly on pathological output.
+    """
+    decoder = json.JSONDecoder()
+    start = text.find('[')
+    while start != -1:
+        try:
+            obj, _ = decoder.raw_decode(text, start)
+            if isinstance(obj, list):
+                return obj
+        except ValueError:
+            pass
+        start = text.find('[', start + 1)
+    return None
+
+
+def _format_kpi_detail(kpi: Dict) -> str:
+    """Render the prompt detail block for one KPI (without its batch index)"""
+    detail = f"KPI: {kpi['name']}"
+    detail += f"\n   Category: {kpi['category']}"
+    detail += f"\n   Data Type: {kpi['data_type']} ({kpi['unit']})"
+    detail += f"\n   Extraction Rule: {kpi['extraction_instruction']}"
+    if kpi.get('search_keywords'):
+        detail += f"\n   Look for keywords: {', '.join(kpi['search_keywords'][:5])}"
+    return detail
+
+
+# KPI detail text is identical across batches and audits; format each once
+_KPI_DETAIL_CACHE = {kpi['name']: _format_kpi_detail(kpi) for kpi in KPIS_DATA}
+
+# Per-audit change signals so SSE streams wake on updates instead of polling
+audit_events: Dict[str, asyncio.Event] = {}
+
+
+def _notify_audit(audit_id: str):
+    """Wake any SSE streams waiting on this audit"""
+    event = audit_events.get(audit_id)
+    if event is not None:
+        event.set()
+
+
+# Storage for audits (memory-first, persisted to SQLite)
+audits_store = AuditStore(
+    Path(os.environ.get('AUDIT_DB_PATH', str(ROOT_DIR / 'audits.db'))),
+    max_size=int(os.environ.get('MAX_STORED_AUDITS', '200'))
+)
+
 # ============ Models ============
 
 class AuditRequest(BaseModel):
@@ -406,7 +752,7 @@ class AuditRequest(BaseModel):
 
 class AuditResponse(BaseModel):
     model_config = ConfigDict(extra="ignore")
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=lambda: uuid.uuid4().hex)
     college_name: str
     status: str = "pending"
     progress: int = 0
@@ -439,42 +785,55 @@ class OfficialSourceValidator:
         'facebook.com', 'instagram.com', 'twitter.com', 'linkedin.com'
     ]
     
+    # Host-level lookup structures: classification parses the hostname once
+    # and does exact/suffix matches, so "reddit.com" in a path or query
+    # string can no longer block (or bless) a URL
+    _BLOCKED_HOSTS = frozenset(BLOCKED_SOURCES)
+    _OFFICIAL_HOSTS = frozenset(
+        p for patterns in OFFICIAL_PATTERNS.values() for p in patterns
+        if not p.startswith('.')
+    )
+    _OFFICIAL_SUFFIXES = ('.ac.in', '.edu.in', '.gov.in', '.nic.in', '.edu', '.gov')
+    
     @classmethod
+    @functools.lru_cache(maxsize=4096)
     def is_official_source(cls, url: str, college_domain: str = None) -> bool:
-        """Check if URL is from an official/trusted source"""
+        """Check if URL is from an official/trusted source (memoized - called per-URL per-KPI)"""
         if not url or url == "N/A":
             return False
         
-        url_lower = url.lower()
-        
-        # Check if blocked
-        for blocked in cls.BLOCKED_SOURCES:
-            if blocked in url_lower:
-                return False
+        try:
+            host = (urlparse(url).hostname or '').lower().removeprefix('www.')
+        except ValueError:
+            return False
+        if not host:
+            return False
         
-        # Check official patterns
-        for source_type, patterns in cls.OFFICIAL_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in url_lower:
-                    return True
+        # Check if blocked (exact host or subdomain of a blocked host)
+        if host in cls._BLOCKED_HOSTS or any(host.endswith('.' + h) for h in cls._BLOCKED_HOSTS):
+            return False
         
-        # Check if it's the college's official website
-        if college_domain and college_domain.lower() in url_lower:
+        # Check official hosts and TLD suffixes
+        if host in cls._OFFICIAL_HOSTS or any(host.endswith('.' + h) for h in cls._OFFICIAL_HOSTS):
+            return True
+        if host.endswith(cls._OFFICIAL_SUFFIXES):
             return True
         
-        # Check for common official patterns
-        if any(ext in url_lower for ext in ['.ac.in', '.edu.in', '.edu', '.gov']):
+        # Check if it's the college's official website
+        if college_domain and college_domain.lower() in host:
             return True
         
         return False
     
     @classmethod
-    def get_source_priority(cls, url: str) -> int:
-        """Get priority score for source (lower = higher priority)"""
+    @functools.lru_cache(maxsize=4096)
+    def get_source_priority(cls, url: str, url_lower: str = None) -> int:
+        """Get priority score for source (lower = higher priority, memoized)"""
         if not url or url == "N/A":
             return 999
         
-        url_lower = url.lower()
+        if url_lower is None:
+            url_lower = url.lower()
         
         # Priority 1: NIRF (most reliable for placements, rankings)
         if 'nirf' in url_lower:
@@ -513,8 +872,24 @@ class OfficialSourceValidator:
 # ============ Retry Logic with Exponential Backoff ============
 
 def retry_with_backoff(max_retries: int = 3, base_delay: float = 0.5, max_delay: float = 8.0):
-    """Decorator for retry logic with exponential backoff"""
+    """Decorator for retry logic with exponential backoff (sync or async)"""
     def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                last_exception = None
+                for attempt in range(max_retries):
+                    try:
+                        return await func(*args, **kwargs)
+                    except Exception as e:
+                        last_exception = e
+                        if attempt < max_retries - 1:
+                            delay = min(base_delay * (2 ** attempt), max_delay)
+                            await asyncio.sleep(delay)
+                            logging.warning(f"Retry {attempt + 1}/{max_retries} for {func.__name__}: {e}")
+                raise last_exception
+            return async_wrapper
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             last_exception = None
@@ -583,16 +958,23 @@ class StructuredDataParser:
             r'ph\.?d\.?\s*programme?[:\s]*(\d+)\s*students?',
         ],
     }
-    
+
+    # Compiled once at class creation so the extraction loop never pays the
+    # pattern-cache lookup per call
+    COMPILED_PATTERNS = {
+        data_type: [re.compile(p, re.IGNORECASE) for p in pattern_list]
+        for data_type, pattern_list in NIRF_PATTERNS.items()
+    }
+
     @classmethod
     def extract_numeric_data(cls, text: str, data_type: str) -> Optional[float]:
         """Extract numeric data using patterns"""
-        if data_type not in cls.NIRF_PATTERNS:
+        if data_type not in cls.COMPILED_PATTERNS:
             return None
-        
+
         text_lower = text.lower()
-        for pattern in cls.NIRF_PATTERNS[data_type]:
-            match = re.search(pattern, text_lower, re.IGNORECASE)
+        for pattern in cls.COMPILED_PATTERNS[data_type]:
+            match = pattern.search(text_lower)
             if match:
                 value_str = match.group(1).replace(',', '')
                 try:
@@ -606,7 +988,7 @@ class StructuredDataParser:
         """Extract data from HTML tables"""
         tables_data = []
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
             for table in soup.find_all('table'):
                 rows = table.find_all('tr')
                 if not rows:
@@ -650,16 +1032,198 @@ class StructuredDataParser:
         return extracted
 
 
+# Precompiled patterns shared by the institute-info extraction path
+_LOCATION_PATTERNS = [re.compile(p) for p in (
+    r'(?:located|situated|based)\s+(?:in|at)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)?',
+    r'(?:city|town|district)\s+(?:of|in)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
+    r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*India',
+)]
+_ESTABLISHED_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(?:established|founded|started)\s+(?:in\s+)?([12][0-9]{3})',
+    r'([12][0-9]{3})\s*[-–]\s*(?:present|now)',
+    r'since\s+([12][0-9]{3})',
+)]
+_TYPE_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(public|private|autonomous|deemed|state|central|national)\s+(?:university|institute|college)',
+    r'(?:is\s+a[n]?)\s+(public|private|autonomous|deemed)\s+(?:research)?\s*(?:university|institute|institution)',
+)]
+_MOTTO_RE = re.compile(r'motto[:\s]+["\']?([^"\n]+)["\']?', re.IGNORECASE)
+_WEBSITE_RE = re.compile(
+    r'(?:website|official\s+site)[:\s]+(?:www\.)?([a-z0-9.-]+\.(?:ac\.in|edu\.in|edu|org))',
+    re.IGNORECASE
+)
+_ABBREV_RE = re.compile(r'\(([A-Z]{2,10})\)')
+# Tags to strip before text extraction: script/style/svg/... never hold
+# visible text, nav/footer/... hold boilerplate we don't want in prompts.
+# (A SoupStrainer can't do this job: with lxml, parse_only only filters
+# top-level tags, so nested script/style nodes still end up in the tree.)
+_STRIP_TAGS = ('script', 'style', 'noscript', 'svg', 'iframe', 'canvas', 'template',
+               'nav', 'footer', 'header', 'aside')
+# Tags that actually carry page prose/data; walking only these avoids
+# allocating a string per NavigableString in the whole tree
+_CONTENT_TAGS = ('p', 'li', 'td', 'th', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6')
+# Cheap title grab from raw bytes, so we never need soup.title
+_TITLE_RE = re.compile(rb'<title[^>]*>([^<]{1,300})</title>', re.IGNORECASE)
+# Single alternation for disclosure-related document links instead of a
+# per-link Python loop over the keyword list
+_DISCLOSURE_KW_RE = re.compile(
+    r'disclosure|faculty|infrastructure|placement|admission|approval|aicte|'
+    r'mandatory|annual|report|ssr|aqar|naac'
+)
+
+
 # ============ KPI Auditor Class ============
 
+def _canon_url(url: str) -> str:
+    """Canonicalize a URL for dedupe: lowercase host, drop fragments,
+    tracking params and trailing slashes so near-duplicates collapse"""
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return url
+    query = '&'.join(
+        kv for kv in parts.query.split('&')
+        if kv and not kv.startswith(('utm_', 'fbclid', 'gclid'))
+    )
+    return urlunsplit((
+        parts.scheme.lower(),
+        (parts.netloc or '').lower(),
+        parts.path.rstrip('/') or '/',
+        query,
+        ''
+    ))
+
+
+def _abbr_after(keyword: str, prefix: str):
+    """Build a handler that abbreviates to '<prefix> <word after keyword>'"""
+    def extract(college_name: str, name_lower: str) -> str:
+        parts = college_name.split()
+        for i, part in enumerate(parts):
+            if part.lower() == keyword and i + 1 < len(parts):
+                return f"{prefix} {parts[i + 1]}"
+        return ""
+    return extract
+
+
+def _abbr_const(abbreviation: str):
+    def extract(college_name: str, name_lower: str) -> str:
+        return abbreviation
+    return extract
+
+
+# Ordered pattern -> handler table replacing the long elif chain; earlier
+# entries win, matching the original check order
+_ABBREVIATION_RULES = (
+    (("indian institute of technology",), _abbr_after("technology", "IIT")),
+    (("national institute of technology",), _abbr_after("technology", "NIT")),
+    (("indian institute of information technology",), _abbr_after("technology", "IIIT")),
+    (("indian institute of management",), _abbr_after("management", "IIM")),
+    (("birla institute of technology",),
+     lambda college_name, name_lower: "BITS Pilani" if "science" in name_lower else "BIT Mesra"),
+    (("vellore institute of technology", "vit"), _abbr_const("VIT")),
+    (("manipal institute of technology",), _abbr_const("MIT Manipal")),
+    (("srm institute", "srm university"), _abbr_const("SRM")),
+    (("amity university",), _abbr_const("Amity")),
+    (("lovely professional university",), _abbr_const("LPU")),
+    (("chandigarh university",), _abbr_const("CU Chandigarh")),
+    (("delhi technological university",), _abbr_const("DTU")),
+    (("netaji subhas",),
+     lambda college_name, name_lower: "NSUT" if "technology" in name_lower else ""),
+    (("pec", "punjab engineering college"), _abbr_const("PEC Chandigarh")),
+    (("thapar",), _abbr_const("Thapar University")),
+    (("anna university",), _abbr_const("Anna University")),
+    (("jadavpur university",), _abbr_const("Jadavpur University")),
+)
+
+
+# Static extraction instructions, shared by every Gemini call. Keeping this
+# as the system instruction (identical prefix across calls) lets the API's
+# implicit prompt caching skip re-processing it; only the per-batch data
+# travels in the user turn.
+_EXTRACTION_SYSTEM_PROMPT = """You are an elite data extraction AI specializing in Indian educational institution KPIs. Your extraction accuracy directly impacts institutional rankings and decisions.
+
+=== EXTRACTION PHILOSOPHY ===
+AGGRESSIVE EXTRACTION: Find data even from indirect mentions. "Data Not Found" is only acceptable if NO related information exists anywhere.
+
+=== ACCURACY REQUIREMENTS ===
+1. EXHAUSTIVE SEARCH: Read EVERY section of source data - data often appears in unexpected places
+2. EXACT EXTRACTION: Copy numbers, percentages, and values exactly as they appear
+3. SMART INFERENCE: Calculate derived values (e.g., percentage from ratio, total from sum of parts)
+4. BOOLEAN LOGIC:
+   - TRUE: Any mention of facility/feature existing (even partial)
+   - FALSE: Explicit statement of non-existence
+   - null: ONLY if topic never mentioned
+5. CONTEXT CLUES: Use related data to infer missing values
+6. PRIORITIZE SOURCES:
+   a) Public Disclosure PDFs (AICTE mandated - highest trust)
+   b) NIRF data (government verified)
+   c) Official website content
+   d) NAAC documents (accreditation verified)
+
+=== CONFIDENCE SCORING ===
+- "high": Direct quote with exact value from official document
+- "medium": Calculated/inferred value OR from search snippets
+- "low": Estimated from context OR partial data
+
+=== DATA TYPE STRATEGIES ===
+| Type | Extraction Strategy |
+|------|---------------------|
+| Integer | Look for: "X students", "total of X", statistics tables |
+| Boolean | Look for: mentions, descriptions, facility lists, infrastructure pages |
+| Array | Look for: lists, menus, program pages, department listings |
+| Float | Look for: percentages, CTCs, ratios, averages |
+| Object | Look for: fee structures, cutoffs, key-value data in tables |
+
+EXTRACTION EXAMPLES:
+Example 1 - Infrastructure:
+If source says "The college has smart classrooms with projectors and LMS system"
+→ ICT-Enabled Learning Infrastructure: true, confidence: high
+
+Example 2 - Numbers from context:
+If source says "We have 15 departments with an average of 50 faculty per department"
+→ Total Faculty: 750 (calculated: 15*50), confidence: medium
+
+Example 3 - Lists from descriptions:
+If source mentions "Our clubs include coding, robotics, music and drama societies"
+→ Active Clubs: ["Coding Club", "Robotics Club", "Music Society", "Drama Society"], confidence: high
+
+OUTPUT FORMAT - Return ONLY valid JSON array (no markdown, no explanation):
+[
+  {
+    "kpi_name": "exact KPI name from list",
+    "category": "category from list",
+    "value": "extracted/derived value OR 'Data Not Found' only if truly absent",
+    "evidence_quote": "exact quote or calculation explanation",
+    "source_url": "URL where found OR 'N/A'",
+    "source_type": "Official College Website/NIRF/NAAC/AICTE/UGC/Public Disclosure/Derived",
+    "confidence": "high/medium/low"
+  }
+]"""
+
+
 class CollegeKPIAuditor:
-    def __init__(self):
-        self.kpis_data = self._load_kpis_from_schema()
-        self.serper_api_key = os.environ.get("SERPER_API_KEY")
-        self.gemini_api_key = os.environ.get("GEMINI_API_KEY")
+    def __init__(self, serper_api_key: Optional[str] = None, gemini_api_key: Optional[str] = None):
+        self.kpis_data = KPIS_DATA
+        # API keys are taken as constructor args so concurrent audits never
+        # need to touch os.environ after startup
+        self.serper_api_key = serper_api_key or os.environ.get("SERPER_API_KEY")
+        # Pace Serper calls at the real quota instead of fixed sleeps
+        self._serper_limiter = AsyncRateLimiter(
+            float(os.environ.get('SERPER_MAX_RPS', '10')), 1.0)
+        # Built once; sent only on Serper requests, never on page fetches
+        self._serper_headers = {
+            'X-API-KEY': self.serper_api_key or '',
+            'Content-Type': 'application/json'
+        }
+        self.gemini_api_key = gemini_api_key or os.environ.get("GEMINI_API_KEY")
         self.validator = OfficialSourceValidator()
         self.parser = StructuredDataParser()
         self.session = requests.Session()
+        # Larger keep-alive pool so Serper + college-site fetches reuse warm
+        # TCP+TLS connections instead of handshaking per request
+        adapter = requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=100)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -669,72 +1233,102 @@ class CollegeKPIAuditor:
         import urllib3
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         self.session.verify = False
+        # Async client for all search/fetch I/O, created lazily so the pool
+        # binds to the running event loop
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Return the shared async HTTP client, creating it on first use"""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                headers=dict(self.session.headers),
+                timeout=httpx.Timeout(25.0),
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                follow_redirects=True,
+                verify=False,
+                http2=_HTTP2_AVAILABLE,
+            )
+        return self._http_client
+
+    async def aclose(self):
+        """Close the async HTTP client pool"""
+        if self._http_client is not None and not self._http_client.is_closed:
+            await self._http_client.aclose()
         
-    def _load_kpis_from_schema(self) -> List[Dict]:
-        """Load KPIs from KPI_SCHEMA constant"""
-        kpis = []
-        for kpi_item in KPI_SCHEMA["college_kpis"]:
-            kpis.append({
-                'name': kpi_item['display_name'],
-                'field_name': kpi_item['field_name'],
-                'category': kpi_item['category'],
-                'data_type': kpi_item['data_type'],
-                'unit': kpi_item['unit'],
-                'validation_rules': kpi_item['validation_rules'],
-                'extraction_instruction': kpi_item['extraction_instruction'],
-                'remarks_required': kpi_item.get('remarks_required', False),
-                'search_keywords': kpi_item.get('search_keywords', []),
-            })
-        logger.info(f"Loaded {len(kpis)} KPIs from schema")
-        return kpis
+    def _kpi_queries(self, college_name: str, kpi: Dict) -> tuple:
+        """Build the (max 3) targeted search queries for a single KPI"""
+        keywords = kpi.get('search_keywords', [])
+        if not keywords:
+            return ()
+        
+        queries = [f'"{college_name}" {keyword}' for keyword in keywords[:2]]
+        
+        # Single merged site-filtered query covering official domains
+        primary_keyword = keywords[0]
+        queries.append(f'(site:.ac.in OR site:.edu.in OR site:nirfindia.org) "{college_name}" {primary_keyword}')
+        return tuple(queries[:3])
 
-    def search_for_kpi(self, college_name: str, kpi: Dict, abbreviation: str = "") -> Dict[str, Any]:
+    async def _prefetch_kpi_queries(self, college_name: str):
+        """Warm the search cache with the deduplicated query set for all KPIs.
+        
+        KPI keyword lists overlap heavily, so firing each unique query exactly
+        once here means the per-KPI searches below are all cache hits - this is
+        what keeps paid Serper calls bounded by the number of distinct queries
+        rather than 3 x 25 KPIs.
+        """
+        unique_queries = {
+            q for kpi in self.kpis_data for q in self._kpi_queries(college_name, kpi)
+        }
+        await self.search_official_sources_batch(sorted(unique_queries), num_results=5)
+        logger.info(f"Prefetched {len(unique_queries)} unique KPI queries via batch search")
+
+    async def search_for_kpi(self, college_name: str, kpi: Dict, abbreviation: str = "") -> Dict[str, Any]:
         """Search specifically for a single KPI using its keywords - ENHANCED VERSION"""
         kpi_data = {
             "kpi_name": kpi['name'],
             "search_results": [],
             "fetched_content": []
         }
-        
-        keywords = kpi.get('search_keywords', [])
-        if not keywords:
+
+        queries = self._kpi_queries(college_name, kpi)
+        if not queries:
             return kpi_data
-        
-        # Build targeted search queries for this KPI - MORE COMPREHENSIVE
-        queries = []
-        
-        # Use top 2 keywords for speed
-        for keyword in keywords[:2]:
-            queries.append(f'"{college_name}" {keyword}')
-        
-        # Add site-specific search for official sources
-        primary_keyword = keywords[0] if keywords else kpi['name']
-        queries.append(f'site:.ac.in OR site:.edu.in "{college_name}" {primary_keyword}')
-        
-        seen_urls = set()
-        
-        # Reduced to 3 queries per KPI for speed
-        for query in queries[:3]:
-            result = self.search_official_sources(query, num_results=5)
-            if result.get("official_results"):
-                for r in result["official_results"]:
-                    url = r.get('url', '')
-                    if url not in seen_urls:
-                        seen_urls.add(url)
-                        kpi_data["search_results"].append(r)
-            time.sleep(0.03)  # Minimal rate limiting
-        
-        # Fetch content from top 3 official URLs for speed
-        urls_to_fetch = [r['url'] for r in kpi_data["search_results"][:3]]
-        
-        for url in urls_to_fetch:
-            content = self.fetch_webpage_content(url, max_length=8000)
+
+        # Fire the (max 3) queries for this KPI concurrently; after the
+        # prefetch pass these resolve from the in-memory cache
+        search_outputs = await asyncio.gather(
+            *[self.search_official_sources(query, num_results=5) for query in queries],
+            return_exceptions=True
+        )
+        # Dict keyed on URL acts as both insertion-ordered storage and dedupe set
+        results_by_url = {}
+        for result in search_outputs:
+            if isinstance(result, BaseException):
+                logger.warning(f"KPI search failed for {kpi['name']}: {result}")
+                continue
+            for r in result.get("official_results") or ():
+                url = r.get('url', '')
+                if url not in results_by_url:
+                    results_by_url[url] = r
+        kpi_data["search_results"] = list(results_by_url.values())
+
+        # Fetch content from the top 3 non-PDF official URLs for speed
+        urls_to_fetch = list(itertools.islice(
+            (u for u in results_by_url if u and not u.lower().endswith('.pdf')), 3))
+
+        fetched = await asyncio.gather(
+            *[self.fetch_webpage_content(url, max_length=8000) for url in urls_to_fetch],
+            return_exceptions=True
+        )
+        for content in fetched:
+            if isinstance(content, BaseException):
+                continue
             if content.get('success'):
                 kpi_data["fetched_content"].append(content)
-        
+
         return kpi_data
 
-    def search_public_disclosure(self, college_name: str, abbreviation: str = "") -> Dict[str, Any]:
+    async def search_public_disclosure(self, college_name: str, abbreviation: str = "") -> Dict[str, Any]:
         """
         Search for Mandatory Public Disclosure pages (AICTE/UGC requirement).
         These pages contain standardized KPI data like faculty, infrastructure, placements, etc.
@@ -757,30 +1351,31 @@ class CollegeKPIAuditor:
             disclosure_queries.append(f'"{abbreviation}" "mandatory disclosure"')
         
         seen_urls = set()
-        
-        # Execute disclosure searches in parallel
-        def run_disclosure_search(query):
-            return self.search_official_sources(query, num_results=10)
-        
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            future_to_query = {executor.submit(run_disclosure_search, q): q for q in disclosure_queries}
-            for future in as_completed(future_to_query):
-                result = future.result()
-                if result.get("official_results"):
-                    for r in result["official_results"]:
-                        url = r.get('url', '')
-                        if url and url not in seen_urls:
-                            seen_urls.add(url)
-                            # Check if it's a PDF
-                            if url.lower().endswith('.pdf'):
-                                disclosure_data["pdfs"].append(r)
-                            else:
-                                disclosure_data["pages"].append(r)
+
+        # Execute disclosure searches concurrently
+        search_outputs = await asyncio.gather(
+            *[self.search_official_sources(q, num_results=10) for q in disclosure_queries],
+            return_exceptions=True
+        )
+        for result in search_outputs:
+            if isinstance(result, BaseException):
+                logger.warning(f"Disclosure search failed: {result}")
+                continue
+            if result.get("official_results"):
+                for r in result["official_results"]:
+                    url = r.get('url', '')
+                    if url and url not in seen_urls:
+                        seen_urls.add(url)
+                        # Check if it's a PDF
+                        if url.lower().endswith('.pdf'):
+                            disclosure_data["pdfs"].append(r)
+                        else:
+                            disclosure_data["pages"].append(r)
         
         logger.info(f"Found {len(disclosure_data['pages'])} disclosure pages and {len(disclosure_data['pdfs'])} PDFs")
         return disclosure_data
 
-    def fetch_disclosure_page_and_pdfs(self, page_url: str, max_pdfs: int = 3) -> Dict[str, Any]:
+    async def fetch_disclosure_page_and_pdfs(self, page_url: str, max_pdfs: int = 3) -> Dict[str, Any]:
         """
         Fetch a disclosure page and extract PDF links from it.
         Returns page content plus any linked PDF content.
@@ -792,11 +1387,18 @@ class CollegeKPIAuditor:
         }
         
         try:
-            # Fetch the HTML page
-            response = self.session.get(page_url, timeout=30, allow_redirects=True, verify=False)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Fetch the HTML page, reusing the raw body if this page was
+            # already downloaded recently (same disclosure page often surfaces
+            # from multiple queries)
+            cache_key = html_cache._get_key(page_url)
+            html_text = html_cache.get(cache_key)
+            if html_text is None:
+                response = await self._get_http_client().get(page_url, timeout=30)
+                response.raise_for_status()
+                html_text = response.text
+                html_cache.set(cache_key, html_text)
+
+            soup = BeautifulSoup(html_text, 'lxml')
             
             # Extract all PDF links from the page
             base_url = '/'.join(page_url.split('/')[:3])
@@ -815,11 +1417,8 @@ class CollegeKPIAuditor:
                         # Relative to current path
                         full_url = '/'.join(page_url.rsplit('/', 1)[:-1]) + '/' + href
                     
-                    # Filter for disclosure-related PDFs
-                    href_lower = href.lower()
-                    if any(kw in href_lower for kw in ['disclosure', 'faculty', 'infrastructure', 'placement', 
-                                                        'admission', 'approval', 'aicte', 'mandatory', 
-                                                        'annual', 'report', 'ssr', 'aqar', 'naac']):
+                    # Filter for disclosure-related PDFs in one compiled scan
+                    if _DISCLOSURE_KW_RE.search(href.lower()):
                         pdf_links.add(full_url)
                     elif len(pdf_links) < max_pdfs:
                         # Include other PDFs if we haven't found disclosure-specific ones
@@ -830,7 +1429,7 @@ class CollegeKPIAuditor:
                 script.decompose()
             
             text = soup.get_text(separator=' ', strip=True)
-            text = re.sub(r'\s+', ' ', text)
+            text = ' '.join(text.split())
             
             result["page_content"] = {
                 "url": page_url,
@@ -840,19 +1439,21 @@ class CollegeKPIAuditor:
             }
             
             result["pdf_links"] = list(pdf_links)[:max_pdfs]
-            
-            # Fetch PDF contents in parallel
-            def fetch_single_pdf(pdf_url):
-                return self._fetch_pdf_content(pdf_url, max_length=25000)
-            
+
+            # Fetch PDF contents in parallel; the PDF download + extraction is
+            # blocking (requests + PyPDF2), so each runs in a worker thread
             if result["pdf_links"]:
-                with ThreadPoolExecutor(max_workers=3) as executor:
-                    future_to_pdf = {executor.submit(fetch_single_pdf, url): url for url in result["pdf_links"]}
-                    for future in as_completed(future_to_pdf):
-                        pdf_content = future.result()
-                        if pdf_content.get("success"):
-                            result["pdf_contents"].append(pdf_content)
-                            logger.info(f"Extracted PDF content: {pdf_content['url']} ({len(pdf_content.get('content', ''))} chars)")
+                pdf_outputs = await asyncio.gather(
+                    *[asyncio.to_thread(self._fetch_pdf_content, url, 25000)
+                      for url in result["pdf_links"]],
+                    return_exceptions=True
+                )
+                for pdf_content in pdf_outputs:
+                    if isinstance(pdf_content, BaseException):
+                        continue
+                    if pdf_content.get("success"):
+                        result["pdf_contents"].append(pdf_content)
+                        logger.info(f"Extracted PDF content: {pdf_content['url']} ({len(pdf_content.get('content', ''))} chars)")
             
         except Exception as e:
             logger.warning(f"Failed to fetch disclosure page {page_url}: {e}")
@@ -902,7 +1503,7 @@ class CollegeKPIAuditor:
                 text_parts.append(page.extract_text())
             
             text = "\n".join(text_parts)
-            text = re.sub(r'\s+', ' ', text)
+            text = ' '.join(text.split())
             
             if len(text) > max_length:
                 text = text[:max_length] + "..."
@@ -918,109 +1519,146 @@ class CollegeKPIAuditor:
             logger.warning(f"Failed to fetch PDF {url}: {e}")
             return {"url": url, "content": "", "error": str(e), "success": False}
 
-    def fetch_webpage_content(self, url: str, max_length: int = 20000, retry_count: int = 2) -> Dict[str, Any]:
+    async def fetch_webpage_content(self, url: str, max_length: int = 20000, retry_count: int = 2) -> Dict[str, Any]:
         """Fetch and extract text content from a webpage with retry logic and CACHING"""
-        # Check cache first
+        # Check in-memory cache first, then the on-disk cache shared across runs
         cache_key = content_cache._get_key(url, max_length)
         cached_result = content_cache.get(cache_key)
         if cached_result is not None:
             logger.debug(f"Cache hit for URL: {url[:50]}...")
             return cached_result
         
+        disk_key = page_disk_cache._get_key(url, max_length)
+        disk_result = page_disk_cache.get(disk_key)
+        if disk_result is not None:
+            logger.debug(f"Disk cache hit for URL: {url[:50]}...")
+            content_cache.set(cache_key, disk_result)
+            return disk_result
+        
         for attempt in range(retry_count):
             try:
-                # Handle PDF files
+                # Handle PDF files (blocking requests + PyPDF2 work in a thread)
                 if url.lower().endswith('.pdf'):
-                    result = self._fetch_pdf_content(url, max_length)
+                    result = await asyncio.to_thread(self._fetch_pdf_content, url, max_length)
                     if result.get("success"):
                         content_cache.set(cache_key, result)
+                        page_disk_cache.set(disk_key, result)
                     return result
                 
-                # Increased timeout and disabled SSL verification
-                response = self.session.get(url, timeout=25, allow_redirects=True, verify=False)
-                response.raise_for_status()
+                # Stream the body and stop once we have enough bytes: pages
+                # are truncated to max_length chars anyway, so there is no
+                # point downloading or decoding a multi-megabyte tail
+                byte_cap = max_length * 4
+                buf = bytearray()
+                async with self._get_http_client().stream('GET', url, timeout=25) as response:
+                    response.raise_for_status()
+                    
+                    # Bail out before downloading the body when the server
+                    # says this is not an HTML page (.pdf suffix filtering
+                    # misses extension-less PDFs, images, zips, ...)
+                    content_type = response.headers.get('content-type', '').lower()
+                    if content_type and not content_type.startswith(('text/html', 'application/xhtml+xml', 'text/plain')):
+                        logger.debug(f"Skipping non-HTML content-type '{content_type}' for {url[:80]}")
+                        return {"url": url, "content": "", "error": f"non-html content-type: {content_type}", "success": False}
+                    
+                    encoding = response.charset_encoding
+                    async for chunk in response.aiter_bytes(chunk_size=65536):
+                        buf.extend(chunk)
+                        if len(buf) >= byte_cap:
+                            break
+                body = bytes(buf)
                 
-                # Parse HTML
-                soup = BeautifulSoup(response.text, 'html.parser')
+                # Parse HTML with the C-backed lxml parser; feeding bytes with an
+                # explicit encoding skips BeautifulSoup's detection pass
+                soup = BeautifulSoup(body, 'lxml', from_encoding=encoding)
                 
                 # Extract tables for structured data
-                tables_data = StructuredDataParser.extract_table_data(response.text)
+                tables_data = StructuredDataParser.extract_table_data(
+                    body.decode(encoding or 'utf-8', errors='replace'))
+                
+                # Remove non-text and boilerplate nodes before extraction
+                for tag in soup(_STRIP_TAGS):
+                    tag.decompose()
                 
-                # Remove script, style elements
-                for script in soup(["script", "style", "nav", "footer", "header", "aside"]):
-                    script.decompose()
+                # Collect text from content-bearing tags only; skip tags nested
+                # inside another content tag so nothing is counted twice
+                chunks = []
+                for t in soup.find_all(_CONTENT_TAGS):
+                    if t.find_parent(_CONTENT_TAGS) is not None:
+                        continue
+                    chunk = t.get_text(' ', strip=True)
+                    if chunk:
+                        chunks.append(chunk)
                 
-                # Get text
-                text = soup.get_text(separator=' ', strip=True)
+                if chunks:
+                    text = ' '.join(chunks)
+                else:
+                    # Pages built without semantic tags: fall back to a full walk
+                    text = soup.get_text(separator=' ', strip=True)
                 
-                # Clean up whitespace
-                text = re.sub(r'\s+', ' ', text)
+                # Clean up whitespace (C-level str tokenizer beats a regex pass here)
+                text = ' '.join(text.split())
                 
                 # Append table data as structured text
                 if tables_data:
                     text += "\n\n=== EXTRACTED TABLES ===\n"
                     for i, table in enumerate(tables_data[:3]):  # Limit to 3 tables
-                        text += f"Table {i+1}: {json.dumps(table['rows'][:10])}\n"
+                        text += f"Table {i+1}: {_json_dumps(table['rows'][:10])}\n"
                 
                 # Truncate if too long
                 if len(text) > max_length:
                     text = text[:max_length] + "..."
                 
+                title_match = _TITLE_RE.search(body)
+                title = title_match.group(1).decode(encoding or 'utf-8', errors='replace').strip() if title_match else ""
+                
                 result = {
                     "url": url,
-                    "title": soup.title.string if soup.title else "",
+                    "title": title,
                     "content": text,
                     "tables": tables_data[:3] if tables_data else [],
                     "success": True
                 }
                 
-                # Cache the result
+                # Cache the result in both tiers
                 content_cache.set(cache_key, result)
+                page_disk_cache.set(disk_key, result)
                 return result
                 
             except Exception as e:
                 if attempt < retry_count - 1:
-                    time.sleep(0.5)  # Reduced wait before retry
+                    await asyncio.sleep(0.5)  # Reduced wait before retry
                     continue
                 logger.warning(f"Failed to fetch {url} after {retry_count} attempts: {e}")
                 return {"url": url, "content": "", "error": str(e), "success": False}
-                return {"url": url, "content": "", "error": str(e), "success": False}
 
-    def fetch_wikipedia_content(self, college_name: str) -> Dict[str, Any]:
-        """Fetch Wikipedia content using Wikipedia API"""
+    async def fetch_wikipedia_content(self, college_name: str) -> Dict[str, Any]:
+        """Fetch Wikipedia content using the API - search and extract in one round trip"""
         try:
-            # Clean and encode college name for Wikipedia search
-            search_term = college_name.replace(" ", "_")
-            
-            # First, search for the page
-            search_url = f"https://en.wikipedia.org/w/api.php?action=query&list=search&srsearch={quote(college_name)}&format=json"
-            response = self.session.get(search_url, timeout=10)
-            search_results = response.json()
-            
-            if not search_results.get('query', {}).get('search'):
-                return {"url": "", "content": "", "success": False, "error": "No Wikipedia page found"}
-            
-            # Get the first result's title
-            page_title = search_results['query']['search'][0]['title']
-            
-            # Now get the page content
-            content_url = f"https://en.wikipedia.org/w/api.php?action=query&prop=extracts&exintro=false&explaintext=true&titles={quote(page_title)}&format=json"
-            response = self.session.get(content_url, timeout=10)
-            content_data = response.json()
+            # generator=search combines the title lookup and the plaintext
+            # extract into a single request (one TLS round trip instead of two)
+            api_url = (
+                "https://en.wikipedia.org/w/api.php?action=query&generator=search"
+                f"&gsrsearch={quote(college_name)}&gsrlimit=1"
+                "&prop=extracts&explaintext=1&exintro=0&format=json"
+            )
+            response = await self._get_http_client().get(api_url, timeout=10)
+            content_data = _json_loads(response.content)
             
             pages = content_data.get('query', {}).get('pages', {})
             for page_id, page_data in pages.items():
                 if page_id != '-1':
                     content = page_data.get('extract', '')
+                    page_title = page_data.get('title', '')
                     wiki_url = f"https://en.wikipedia.org/wiki/{quote(page_title.replace(' ', '_'))}"
                     return {
                         "url": wiki_url,
-                        "title": page_data.get('title', ''),
+                        "title": page_title,
                         "content": content[:20000] if len(content) > 20000 else content,
                         "success": True
                     }
             
-            return {"url": "", "content": "", "success": False, "error": "Page content not found"}
+            return {"url": "", "content": "", "success": False, "error": "No Wikipedia page found"}
             
         except Exception as e:
             logger.warning(f"Wikipedia fetch failed: {e}")
@@ -1048,14 +1686,8 @@ class CollegeKPIAuditor:
             content = wiki_content[:5000]  # First part usually has key info
             
             # Extract location patterns
-            location_patterns = [
-                r'(?:located|situated|based)\s+(?:in|at)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),?\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)?',
-                r'(?:city|town|district)\s+(?:of|in)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)',
-                r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*India',
-            ]
-            
-            for pattern in location_patterns:
-                match = re.search(pattern, content)
+            for pattern in _LOCATION_PATTERNS:
+                match = pattern.search(content)
                 if match:
                     groups = match.groups()
                     if groups[0]:
@@ -1067,37 +1699,26 @@ class CollegeKPIAuditor:
                     break
             
             # Extract establishment year
-            established_patterns = [
-                r'(?:established|founded|started)\s+(?:in\s+)?([12][0-9]{3})',
-                r'([12][0-9]{3})\s*[-–]\s*(?:present|now)',
-                r'since\s+([12][0-9]{3})',
-            ]
-            
-            for pattern in established_patterns:
-                match = re.search(pattern, content, re.IGNORECASE)
+            for pattern in _ESTABLISHED_PATTERNS:
+                match = pattern.search(content)
                 if match:
                     institute_info["established"] = match.group(1)
                     break
             
             # Extract type of institution
-            type_patterns = [
-                r'(public|private|autonomous|deemed|state|central|national)\s+(?:university|institute|college)',
-                r'(?:is\s+a[n]?)\s+(public|private|autonomous|deemed)\s+(?:research)?\s*(?:university|institute|institution)',
-            ]
-            
-            for pattern in type_patterns:
-                match = re.search(pattern, content, re.IGNORECASE)
+            for pattern in _TYPE_PATTERNS:
+                match = pattern.search(content)
                 if match:
                     institute_info["type"] = match.group(1).title()
                     break
             
             # Extract motto
-            motto_match = re.search(r'motto[:\s]+["\']?([^"\n]+)["\']?', content, re.IGNORECASE)
+            motto_match = _MOTTO_RE.search(content)
             if motto_match:
                 institute_info["motto"] = motto_match.group(1).strip()[:100]
             
             # Extract website
-            website_match = re.search(r'(?:website|official\s+site)[:\s]+(?:www\.)?([a-z0-9.-]+\.(?:ac\.in|edu\.in|edu|org))', content, re.IGNORECASE)
+            website_match = _WEBSITE_RE.search(content)
             if website_match:
                 institute_info["website"] = f"https://www.{website_match.group(1)}"
             
@@ -1105,7 +1726,7 @@ class CollegeKPIAuditor:
             words = college_name.split()
             if len(words) > 2:
                 # Check for common abbreviations in content
-                abbrev_match = re.search(r'\(([A-Z]{2,10})\)', content)
+                abbrev_match = _ABBREV_RE.search(content)
                 if abbrev_match:
                     institute_info["short_name"] = abbrev_match.group(1)
                 else:
@@ -1120,17 +1741,25 @@ class CollegeKPIAuditor:
         return institute_info
 
     @retry_with_backoff(max_retries=3, base_delay=0.5)
-    def search_official_sources(self, query: str, num_results: int = 10) -> Dict[str, Any]:
+    async def search_official_sources(self, query: str, num_results: int = 10) -> Dict[str, Any]:
         """Perform web search with strict filtering for official sources only - WITH CACHING"""
         if not self.serper_api_key:
             return {"error": "SERPER_API_KEY not set", "results": []}
         
-        # Check cache first
+        # Check in-memory cache first, then the on-disk cache (which survives
+        # restarts and makes retries quota-free)
         cache_key = search_cache._get_key(query, num_results)
         cached_result = search_cache.get(cache_key)
         if cached_result is not None:
             logger.debug(f"Cache hit for query: {query[:50]}...")
             return cached_result
+
+        disk_key = serper_disk_cache._get_key(query, num_results)
+        disk_result = serper_disk_cache.get(disk_key)
+        if disk_result is not None:
+            logger.debug(f"Disk cache hit for query: {query[:50]}...")
+            search_cache.set(cache_key, disk_result)
+            return disk_result
         
         url = "https://google.serper.dev/search"
         payload = {
@@ -1139,81 +1768,134 @@ class CollegeKPIAuditor:
             "gl": "in",
             "hl": "en"
         }
-        headers = {
-            'X-API-KEY': self.serper_api_key,
-            'Content-Type': 'application/json'
-        }
-        
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            async with self._serper_limiter:
+                response = await self._get_http_client().post(url, headers=self._serper_headers, json=payload, timeout=30)
             response.raise_for_status()
-            results = response.json()
-            
-            filtered_results = []
-            
-            # Process organic results - filter for official sources only
-            for r in results.get("organic", []):
-                link = r.get('link', '')
-                
-                # Skip non-official sources
-                is_blocked = any(blocked in link.lower() for blocked in self.validator.BLOCKED_SOURCES)
-                if is_blocked:
-                    continue
-                
-                # Check if official
-                is_official = self.validator.is_official_source(link)
-                
-                if is_official:
-                    filtered_results.append({
-                        'title': r.get('title', ''),
-                        'url': link,
-                        'snippet': r.get('snippet', ''),
-                        'priority': self.validator.get_source_priority(link),
-                        'source_type': self._identify_source_type(link)
-                    })
-            
-            # Sort by priority (lower = better)
-            filtered_results.sort(key=lambda x: x['priority'])
+            results = _json_loads(response.content)
             
-            # Process Knowledge Graph if available
-            knowledge_graph = None
-            if "knowledgeGraph" in results:
-                kg = results["knowledgeGraph"]
-                knowledge_graph = {k: v for k, v in kg.items() if isinstance(v, (str, int, float, list))}
+            result = self._filter_serper_response(query, results)
             
-            result = {
-                "query": query,
-                "official_results": filtered_results,
-                "knowledge_graph": knowledge_graph,
-                "total_found": len(filtered_results)
-            }
-            
-            # Cache the result
+            # Cache the result in memory and on disk
             search_cache.set(cache_key, result)
-            
+            serper_disk_cache.set(disk_key, result)
+
             return result
             
         except Exception as e:
             logger.error(f"Search failed for query '{query}': {e}")
             return {"error": str(e), "results": []}
-    
-    def _identify_source_type(self, url: str) -> str:
-        """Identify the type of official source"""
-        url_lower = url.lower()
+
+    def _filter_serper_response(self, query: str, results: Dict[str, Any]) -> Dict[str, Any]:
+        """Filter one raw Serper response down to official sources only"""
+        filtered_results = []
         
-        if 'nirf' in url_lower:
-            return "NIRF"
-        elif 'naac' in url_lower:
-            return "NAAC"
-        elif '.ac.in' in url_lower or '.edu.in' in url_lower:
-            return "Official College Website"
-        elif 'aicte' in url_lower:
-            return "AICTE"
-        elif 'ugc' in url_lower:
-            return "UGC"
-        elif '.gov.in' in url_lower:
-            return "Government"
+        # Process organic results - filter for official sources only.
+        # is_official_source already rejects blocked hosts via the
+        # frozenset lookup, so no separate substring scan is needed here.
+        for r in results.get("organic", []):
+            link = r.get('link', '')
+            
+            if self.validator.is_official_source(link):
+                # Lowercase once and share it across the classifiers
+                link_lower = link.lower()
+                filtered_results.append({
+                    'title': r.get('title', ''),
+                    'url': link,
+                    'snippet': r.get('snippet', ''),
+                    'priority': self.validator.get_source_priority(link, link_lower),
+                    'source_type': self._identify_source_type(link, link_lower)
+                })
+        
+        # Keep only the top results by priority (lower = better); downstream
+        # consumers never read past the first ten, so an O(N log K)
+        # nsmallest beats a full sort and the C itemgetter beats a lambda
+        filtered_results = heapq.nsmallest(10, filtered_results,
+                                           key=operator.itemgetter('priority'))
+        
+        # Process Knowledge Graph if available
+        knowledge_graph = None
+        if "knowledgeGraph" in results:
+            kg = results["knowledgeGraph"]
+            knowledge_graph = {k: v for k, v in kg.items() if isinstance(v, (str, int, float, list))}
+        
+        return {
+            "query": query,
+            "official_results": filtered_results,
+            "knowledge_graph": knowledge_graph,
+            "total_found": len(filtered_results)
+        }
+
+    async def search_official_sources_batch(self, queries: List[str], num_results: int = 5):
+        """Resolve many queries with one Serper array POST, filling both cache tiers.
+        
+        Serper accepts a list payload and returns one response per entry, so
+        N uncached queries cost a single HTTP round trip instead of N.
+        """
+        if not self.serper_api_key:
+            return
+        
+        pending = []
+        for query in queries:
+            cache_key = search_cache._get_key(query, num_results)
+            if search_cache.get(cache_key) is not None:
+                continue
+            disk_key = serper_disk_cache._get_key(query, num_results)
+            disk_result = serper_disk_cache.get(disk_key)
+            if disk_result is not None:
+                search_cache.set(cache_key, disk_result)
+                continue
+            pending.append(query)
+        
+        if not pending:
+            return
         
+        url = "https://google.serper.dev/search"
+        # Stay well under Serper's batch ceiling
+        for start in range(0, len(pending), 50):
+            chunk = pending[start:start + 50]
+            payload = [{"q": q, "num": num_results, "gl": "in", "hl": "en"} for q in chunk]
+            try:
+                async with self._serper_limiter:
+                    response = await self._get_http_client().post(
+                        url, headers=self._serper_headers, json=payload, timeout=60)
+                response.raise_for_status()
+                raw_responses = _json_loads(response.content)
+            except Exception as e:
+                logger.warning(f"Batch search failed for {len(chunk)} queries: {e}")
+                continue
+            
+            if not isinstance(raw_responses, list) or len(raw_responses) != len(chunk):
+                logger.warning("Unexpected batch search response shape; skipping chunk")
+                continue
+            
+            for query, raw in zip(chunk, raw_responses):
+                result = self._filter_serper_response(query, raw)
+                search_cache.set(search_cache._get_key(query, num_results), result)
+                serper_disk_cache.set(serper_disk_cache._get_key(query, num_results), result)
+    
+    # One compiled scan collecting every marker, then a dispatch in the
+    # original precedence order - replaces seven substring checks per URL
+    _SOURCE_TYPE_RE = re.compile(
+        r'(?P<nirf>nirf)|(?P<naac>naac)|(?P<college>\.ac\.in|\.edu\.in)|'
+        r'(?P<aicte>aicte)|(?P<ugc>ugc)|(?P<govin>\.gov\.in)'
+    )
+    _SOURCE_TYPE_ORDER = (
+        ('nirf', "NIRF"),
+        ('naac', "NAAC"),
+        ('college', "Official College Website"),
+        ('aicte', "AICTE"),
+        ('ugc', "UGC"),
+        ('govin', "Government"),
+    )
+
+    def _identify_source_type(self, url: str, url_lower: str = None) -> str:
+        """Identify the type of official source"""
+        kinds = {m.lastgroup for m in self._SOURCE_TYPE_RE.finditer(url_lower if url_lower is not None else url.lower())}
+        if kinds:
+            for kind, source_type in self._SOURCE_TYPE_ORDER:
+                if kind in kinds:
+                    return source_type
         return "Other Official"
 
     async def gather_official_data(self, college_name: str, progress_callback=None) -> Dict[str, Any]:
@@ -1243,7 +1925,13 @@ class CollegeKPIAuditor:
         if abbreviation:
             search_names.append(abbreviation)
         
-        combined_text_parts = []
+        # Stream prompt fragments into one buffer instead of accumulating a
+        # list of strings and joining at the end
+        _text_buf = io.StringIO()
+        
+        def _emit(fragment: str):
+            _text_buf.write(fragment)
+            _text_buf.write("\n\n")
         
         # ============ PRIORITY 1: OFFICIAL COLLEGE WEBSITE ============
         if progress_callback:
@@ -1262,21 +1950,22 @@ class CollegeKPIAuditor:
         
         official_urls_to_fetch = set()
         
-        # Execute searches in parallel using ThreadPoolExecutor
-        def run_search(query):
-            return self.search_official_sources(query, num_results=8)
-        
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            future_to_query = {executor.submit(run_search, q): q for q in official_queries}
-            for future in as_completed(future_to_query):
-                result = future.result()
-                if result.get("official_results"):
-                    for r in result["official_results"]:
-                        if r['source_type'] == "Official College Website":
-                            all_data["official_website"].append(r)
-                            combined_text_parts.append(f"[OFFICIAL WEBSITE SEARCH]\nTitle: {r['title']}\nURL: {r['url']}\nSnippet: {r['snippet']}\n")
-                            if r['url'] and not r['url'].lower().endswith('.pdf'):
-                                official_urls_to_fetch.add(r['url'])
+        # Execute searches concurrently on the shared async client
+        search_results = await asyncio.gather(
+            *[self.search_official_sources(q, num_results=8) for q in official_queries],
+            return_exceptions=True
+        )
+        for result in search_results:
+            if isinstance(result, BaseException):
+                logger.warning(f"Official website search failed: {result}")
+                continue
+            if result.get("official_results"):
+                for r in result["official_results"]:
+                    if r['source_type'] == "Official College Website":
+                        all_data["official_website"].append(r)
+                        _emit(f"[OFFICIAL WEBSITE SEARCH]\nTitle: {r['title']}\nURL: {r['url']}\nSnippet: {r['snippet']}\n")
+                        if r['url'] and not r['url'].lower().endswith('.pdf'):
+                            official_urls_to_fetch.add(r['url'])
         
         if progress_callback:
             await progress_callback(f"Official website search complete", 35)
@@ -1285,75 +1974,73 @@ class CollegeKPIAuditor:
         if progress_callback:
             await progress_callback("Fetching official website content...", 40)
         
-        urls_to_fetch = [u for u in list(official_urls_to_fetch)[:8] if u not in all_data["fetched_urls"]]
-        
-        def fetch_url(url):
-            try:
-                return self.fetch_webpage_content(url, max_length=10000)
-            except Exception as e:
-                logger.warning(f"Failed to fetch {url}: {e}")
-                return None
-        
-        with ThreadPoolExecutor(max_workers=6) as executor:
-            future_to_url = {executor.submit(fetch_url, url): url for url in urls_to_fetch}
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
-                page_content = future.result()
-                if page_content and page_content.get("success") and page_content.get("content"):
-                    all_data["official_website_content"].append(page_content)
-                    all_data["fetched_urls"].add(url)
-                    combined_text_parts.append(f"[OFFICIAL WEBSITE PAGE CONTENT]\nURL: {url}\nTitle: {page_content.get('title', '')}\nContent: {page_content['content']}\n")
-                    logger.info(f"Fetched official page: {url} ({len(page_content['content'])} chars)")
+        urls_to_fetch = [u for u in list(official_urls_to_fetch)[:8]
+                         if _canon_url(u) not in all_data["fetched_urls"]]
+        
+        page_contents = await asyncio.gather(
+            *[self.fetch_webpage_content(url, max_length=10000) for url in urls_to_fetch],
+            return_exceptions=True
+        )
+        for url, page_content in zip(urls_to_fetch, page_contents):
+            if isinstance(page_content, BaseException):
+                logger.warning(f"Failed to fetch {url}: {page_content}")
+                continue
+            if page_content and page_content.get("success") and page_content.get("content"):
+                all_data["official_website_content"].append(page_content)
+                all_data["fetched_urls"].add(_canon_url(url))
+                _emit(f"[OFFICIAL WEBSITE PAGE CONTENT]\nURL: {url}\nTitle: {page_content.get('title', '')}\nContent: {page_content['content']}\n")
+                logger.info(f"Fetched official page: {url} ({len(page_content['content'])} chars)")
         
         # ============ PRIORITY 2.5: MANDATORY PUBLIC DISCLOSURE (AICTE/UGC) ============
         if progress_callback:
             await progress_callback("Searching Mandatory Public Disclosure pages...", 45)
         
         # Search for public disclosure pages and PDFs
-        disclosure_data = self.search_public_disclosure(clean_name, abbreviation)
+        disclosure_data = await self.search_public_disclosure(clean_name, abbreviation)
         
         # Process disclosure pages - these contain standardized KPI data
         disclosure_pages_to_fetch = []
         for page in disclosure_data.get("pages", [])[:4]:
             all_data["public_disclosure"].append(page)
             disclosure_pages_to_fetch.append(page['url'])
-            combined_text_parts.append(f"[PUBLIC DISCLOSURE PAGE]\nTitle: {page['title']}\nURL: {page['url']}\nSnippet: {page['snippet']}\n")
+            _emit(f"[PUBLIC DISCLOSURE PAGE]\nTitle: {page['title']}\nURL: {page['url']}\nSnippet: {page['snippet']}\n")
         
         # Fetch disclosure pages and extract PDFs from them
         if disclosure_pages_to_fetch:
             if progress_callback:
                 await progress_callback("Fetching Public Disclosure pages and PDFs...", 48)
             
-            def fetch_disclosure_with_pdfs(page_url):
-                return self.fetch_disclosure_page_and_pdfs(page_url, max_pdfs=2)
-            
-            with ThreadPoolExecutor(max_workers=4) as executor:
-                future_to_page = {executor.submit(fetch_disclosure_with_pdfs, url): url for url in disclosure_pages_to_fetch[:3]}
-                for future in as_completed(future_to_page):
-                    page_url = future_to_page[future]
-                    result = future.result()
-                    
-                    # Add page content
-                    if result.get("page_content") and result["page_content"].get("success"):
-                        all_data["public_disclosure_content"].append(result["page_content"])
-                        all_data["fetched_urls"].add(page_url)
-                        combined_text_parts.append(f"[PUBLIC DISCLOSURE PAGE CONTENT]\nURL: {page_url}\nTitle: {result['page_content'].get('title', '')}\nContent: {result['page_content']['content']}\n")
-                        logger.info(f"Fetched disclosure page: {page_url}")
-                    
-                    # Add PDF contents - these are gold for KPIs
-                    for pdf_content in result.get("pdf_contents", []):
-                        all_data["public_disclosure_content"].append(pdf_content)
-                        combined_text_parts.append(f"[PUBLIC DISCLOSURE PDF - HIGH VALUE KPI DATA]\nURL: {pdf_content['url']}\nTitle: {pdf_content.get('title', 'PDF Document')}\nContent: {pdf_content['content']}\n")
-                        logger.info(f"Extracted disclosure PDF: {pdf_content['url']} ({len(pdf_content.get('content', ''))} chars)")
+            pages_batch = disclosure_pages_to_fetch[:3]
+            disclosure_results = await asyncio.gather(
+                *[self.fetch_disclosure_page_and_pdfs(url, max_pdfs=2) for url in pages_batch],
+                return_exceptions=True
+            )
+            for page_url, result in zip(pages_batch, disclosure_results):
+                if isinstance(result, BaseException):
+                    logger.warning(f"Failed to fetch disclosure page {page_url}: {result}")
+                    continue
+                
+                # Add page content
+                if result.get("page_content") and result["page_content"].get("success"):
+                    all_data["public_disclosure_content"].append(result["page_content"])
+                    all_data["fetched_urls"].add(_canon_url(page_url))
+                    _emit(f"[PUBLIC DISCLOSURE PAGE CONTENT]\nURL: {page_url}\nTitle: {result['page_content'].get('title', '')}\nContent: {result['page_content']['content']}\n")
+                    logger.info(f"Fetched disclosure page: {page_url}")
+                
+                # Add PDF contents - these are gold for KPIs
+                for pdf_content in result.get("pdf_contents", []):
+                    all_data["public_disclosure_content"].append(pdf_content)
+                    _emit(f"[PUBLIC DISCLOSURE PDF - HIGH VALUE KPI DATA]\nURL: {pdf_content['url']}\nTitle: {pdf_content.get('title', 'PDF Document')}\nContent: {pdf_content['content']}\n")
+                    logger.info(f"Extracted disclosure PDF: {pdf_content['url']} ({len(pdf_content.get('content', ''))} chars)")
         
         # Also directly fetch any PDFs found in search results
         for pdf in disclosure_data.get("pdfs", [])[:3]:
-            if pdf['url'] not in all_data["fetched_urls"]:
-                pdf_content = self._fetch_pdf_content(pdf['url'], max_length=25000)
+            if _canon_url(pdf['url']) not in all_data["fetched_urls"]:
+                pdf_content = await asyncio.to_thread(self._fetch_pdf_content, pdf['url'], 25000)
                 if pdf_content.get("success"):
                     all_data["public_disclosure_content"].append(pdf_content)
-                    all_data["fetched_urls"].add(pdf['url'])
-                    combined_text_parts.append(f"[PUBLIC DISCLOSURE PDF - DIRECT]\nURL: {pdf['url']}\nTitle: {pdf.get('title', 'PDF')}\nContent: {pdf_content['content']}\n")
+                    all_data["fetched_urls"].add(_canon_url(pdf['url']))
+                    _emit(f"[PUBLIC DISCLOSURE PDF - DIRECT]\nURL: {pdf['url']}\nTitle: {pdf.get('title', 'PDF')}\nContent: {pdf_content['content']}\n")
                     logger.info(f"Fetched direct disclosure PDF: {pdf['url']}")
         
         if progress_callback:
@@ -1373,27 +2060,31 @@ class CollegeKPIAuditor:
             nirf_queries.append(f'site:nirfindia.org "{abbreviation}"')
         
         # Parallel NIRF search
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            future_to_query = {executor.submit(run_search, q): q for q in nirf_queries}
-            for future in as_completed(future_to_query):
-                result = future.result()
-                if result.get("official_results"):
-                    for r in result["official_results"]:
-                        if r['source_type'] == "NIRF" or 'nirf' in r['url'].lower():
-                            all_data["nirf"].append(r)
-                            combined_text_parts.append(f"[NIRF]\nTitle: {r['title']}\nURL: {r['url']}\nData: {r['snippet']}\n")
+        nirf_results = await asyncio.gather(
+            *[self.search_official_sources(q, num_results=8) for q in nirf_queries],
+            return_exceptions=True
+        )
+        for result in nirf_results:
+            if isinstance(result, BaseException):
+                logger.warning(f"NIRF search failed: {result}")
+                continue
+            if result.get("official_results"):
+                for r in result["official_results"]:
+                    if r['source_type'] == "NIRF" or 'nirf' in r['url'].lower():
+                        all_data["nirf"].append(r)
+                        _emit(f"[NIRF]\nTitle: {r['title']}\nURL: {r['url']}\nData: {r['snippet']}\n")
         
         # ============ PRIORITY 4: NAAC DOCUMENTS ============
         if progress_callback:
             await progress_callback("Searching NAAC Documents...", 65)
         
         naac_query = f'site:naac.gov.in "{clean_name}" OR "{clean_name}" NAAC accreditation'
-        result = self.search_official_sources(naac_query, num_results=5)
+        result = await self.search_official_sources(naac_query, num_results=5)
         if result.get("official_results"):
             for r in result["official_results"]:
                 if 'naac' in r['url'].lower():
                     all_data["naac"].append(r)
-                    combined_text_parts.append(f"[NAAC]\nTitle: {r['title']}\nURL: {r['url']}\nData: {r['snippet']}\n")
+                    _emit(f"[NAAC]\nTitle: {r['title']}\nURL: {r['url']}\nData: {r['snippet']}\n")
         
         # ============ PRIORITY 5: PER-KPI TARGETED SEARCH (PARALLEL) ============
         if progress_callback:
@@ -1401,30 +2092,40 @@ class CollegeKPIAuditor:
         
         all_data["kpi_specific_data"] = {}
         
-        # Search KPIs in parallel batches
-        def search_single_kpi(kpi):
-            return (kpi['name'], self.search_for_kpi(clean_name, kpi, abbreviation))
-        
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            future_to_kpi = {executor.submit(search_single_kpi, kpi): kpi for kpi in self.kpis_data}
-            for future in as_completed(future_to_kpi):
-                kpi_name, kpi_search_data = future.result()
-                all_data["kpi_specific_data"][kpi_name] = kpi_search_data
-                
-                # Add to combined text
-                if kpi_search_data["search_results"]:
-                    combined_text_parts.append(f"\n[KPI-SPECIFIC: {kpi_name}]")
-                    for r in kpi_search_data["search_results"][:2]:
-                        combined_text_parts.append(f"  Source: {r['url']}\n  Snippet: {r['snippet']}")
-                
-                if kpi_search_data["fetched_content"]:
-                    for content in kpi_search_data["fetched_content"][:1]:
-                        combined_text_parts.append(f"  [Fetched Page for {kpi_name}]\n  URL: {content['url']}\n  Content: {content['content'][:2000]}")
+        # Warm the cache with the deduplicated query set, then search KPIs
+        # concurrently, bounded so we do not flood Serper
+        await self._prefetch_kpi_queries(clean_name)
+        kpi_sem = asyncio.Semaphore(8)
+        
+        async def search_single_kpi(kpi):
+            async with kpi_sem:
+                return (kpi['name'], await self.search_for_kpi(clean_name, kpi, abbreviation))
+        
+        kpi_results = await asyncio.gather(
+            *[search_single_kpi(kpi) for kpi in self.kpis_data],
+            return_exceptions=True
+        )
+        for kpi_result in kpi_results:
+            if isinstance(kpi_result, BaseException):
+                logger.warning(f"KPI-specific search failed: {kpi_result}")
+                continue
+            kpi_name, kpi_search_data = kpi_result
+            all_data["kpi_specific_data"][kpi_name] = kpi_search_data
+            
+            # Add to combined text
+            if kpi_search_data["search_results"]:
+                _emit(f"\n[KPI-SPECIFIC: {kpi_name}]")
+                for r in kpi_search_data["search_results"][:2]:
+                    _emit(f"  Source: {r['url']}\n  Snippet: {r['snippet']}")
+            
+            if kpi_search_data["fetched_content"]:
+                for content in kpi_search_data["fetched_content"][:1]:
+                    _emit(f"  [Fetched Page for {kpi_name}]\n  URL: {content['url']}\n  Content: {content['content'][:2000]}")
         
         if progress_callback:
             await progress_callback(f"KPI-specific search complete", 85)
         
-        all_data["combined_text"] = "\n\n".join(combined_text_parts)
+        all_data["combined_text"] = _text_buf.getvalue()
         
         # Convert set to list for JSON serialization
         all_data["fetched_urls"] = list(all_data["fetched_urls"])
@@ -1442,59 +2143,11 @@ class CollegeKPIAuditor:
         """Get common abbreviation for college name"""
         name_lower = college_name.lower()
         
-        if "indian institute of technology" in name_lower:
-            parts = college_name.split()
-            for i, part in enumerate(parts):
-                if part.lower() == "technology" and i + 1 < len(parts):
-                    location = parts[i + 1]
-                    return f"IIT {location}"
-        elif "national institute of technology" in name_lower:
-            parts = college_name.split()
-            for i, part in enumerate(parts):
-                if part.lower() == "technology" and i + 1 < len(parts):
-                    location = parts[i + 1]
-                    return f"NIT {location}"
-        elif "indian institute of information technology" in name_lower:
-            parts = college_name.split()
-            for i, part in enumerate(parts):
-                if part.lower() == "technology" and i + 1 < len(parts):
-                    location = parts[i + 1]
-                    return f"IIIT {location}"
-        elif "indian institute of management" in name_lower:
-            parts = college_name.split()
-            for i, part in enumerate(parts):
-                if part.lower() == "management" and i + 1 < len(parts):
-                    location = parts[i + 1]
-                    return f"IIM {location}"
-        elif "birla institute of technology" in name_lower:
-            if "science" in name_lower:
-                return "BITS Pilani"
-            else:
-                return "BIT Mesra"
-        elif "vellore institute of technology" in name_lower or "vit" in name_lower:
-            return "VIT"
-        elif "manipal institute of technology" in name_lower:
-            return "MIT Manipal"
-        elif "srm institute" in name_lower or "srm university" in name_lower:
-            return "SRM"
-        elif "amity university" in name_lower:
-            return "Amity"
-        elif "lovely professional university" in name_lower:
-            return "LPU"
-        elif "chandigarh university" in name_lower:
-            return "CU Chandigarh"
-        elif "delhi technological university" in name_lower:
-            return "DTU"
-        elif "netaji subhas" in name_lower and "technology" in name_lower:
-            return "NSUT"
-        elif "pec" in name_lower or "punjab engineering college" in name_lower:
-            return "PEC Chandigarh"
-        elif "thapar" in name_lower:
-            return "Thapar University"
-        elif "anna university" in name_lower:
-            return "Anna University"
-        elif "jadavpur university" in name_lower:
-            return "Jadavpur University"
+        for patterns, handler in _ABBREVIATION_RULES:
+            if any(p in name_lower for p in patterns):
+                abbreviation = handler(college_name, name_lower)
+                if abbreviation:
+                    return abbreviation
         
         return ""
 
@@ -1502,34 +2155,46 @@ class CollegeKPIAuditor:
                                                search_data: Dict[str, Any], client) -> List[Dict]:
         """Extract KPI values using Gemini with STRICT official source validation and per-KPI data"""
         
-        # Build structured data from official sources - prioritize FULL content
-        source_sections = []
+        # Build structured data from official sources - prioritize FULL content.
+        # Sections are already ordered by priority, so write straight into a
+        # capped buffer and stop once the API budget is full rather than
+        # building >120K of strings and slicing afterwards
+        _content_cap = 120000
+        _content_buf = io.StringIO()
+        
+        def _emit(fragment: str) -> bool:
+            """Write a prompt line; returns False once the budget is spent"""
+            if _content_buf.tell() >= _content_cap:
+                return False
+            _content_buf.write(fragment)
+            _content_buf.write("\n")
+            return True
         
         # Add pre-extracted structured data if available
         if search_data.get("structured_extracted"):
-            source_sections.append("=== PRE-EXTRACTED STRUCTURED DATA (VERIFIED NUMERIC VALUES) ===")
+            _emit("=== PRE-EXTRACTED STRUCTURED DATA (VERIFIED NUMERIC VALUES) ===")
             for key, value in search_data["structured_extracted"].items():
-                source_sections.append(f"{key}: {value}")
-            source_sections.append("")
+                _emit(f"{key}: {value}")
+            _emit("")
         
         # PRIORITY 0 (HIGHEST): PUBLIC DISCLOSURE PAGES AND PDFs (AICTE Mandatory Data)
         if search_data.get("public_disclosure_content"):
-            source_sections.append("=== MANDATORY PUBLIC DISCLOSURE (HIGHEST PRIORITY - AICTE/UGC VERIFIED DATA) ===")
-            source_sections.append("NOTE: This data is from mandatory disclosure documents required by AICTE/UGC. It contains verified KPIs.")
+            _emit("=== MANDATORY PUBLIC DISCLOSURE (HIGHEST PRIORITY - AICTE/UGC VERIFIED DATA) ===")
+            _emit("NOTE: This data is from mandatory disclosure documents required by AICTE/UGC. It contains verified KPIs.")
             for item in search_data["public_disclosure_content"][:6]:
-                source_sections.append(f"Document URL: {item.get('url', '')}")
-                source_sections.append(f"Document Title: {item.get('title', '')}")
-                source_sections.append(f"Content:\n{item.get('content', '')[:12000]}")
-                source_sections.append("")
+                _emit(f"Document URL: {item.get('url', '')}")
+                _emit(f"Document Title: {item.get('title', '')}")
+                _emit(f"Content:\n{item.get('content', '')[:12000]}")
+                _emit("")
         
         # PRIORITY 1: Fetched Official Website Content
         if search_data.get("official_website_content"):
-            source_sections.append("=== OFFICIAL COLLEGE WEBSITE - FETCHED PAGES (HIGH PRIORITY) ===")
+            _emit("=== OFFICIAL COLLEGE WEBSITE - FETCHED PAGES (HIGH PRIORITY) ===")
             for item in search_data["official_website_content"][:5]:
-                source_sections.append(f"Page URL: {item['url']}")
-                source_sections.append(f"Page Title: {item.get('title', '')}")
-                source_sections.append(f"Page Content:\n{item['content'][:8000]}")
-                source_sections.append("")
+                _emit(f"Page URL: {item['url']}")
+                _emit(f"Page Title: {item.get('title', '')}")
+                _emit(f"Page Content:\n{item['content'][:8000]}")
+                _emit("")
         
         # PRIORITY 3: KPI-SPECIFIC SEARCH DATA (NEW - Very Important!)
         kpi_specific_data = search_data.get("kpi_specific_data", {})
@@ -1538,100 +2203,59 @@ class CollegeKPIAuditor:
             if kpi_name in kpi_specific_data:
                 kpi_data = kpi_specific_data[kpi_name]
                 if kpi_data.get("search_results") or kpi_data.get("fetched_content"):
-                    source_sections.append(f"=== KPI-SPECIFIC DATA FOR: {kpi_name} ===")
+                    _emit(f"=== KPI-SPECIFIC DATA FOR: {kpi_name} ===")
                     
                     # Add fetched content first (higher priority)
                     for content in kpi_data.get("fetched_content", [])[:2]:
-                        source_sections.append(f"[Fetched Page] URL: {content['url']}")
-                        source_sections.append(f"Content: {content['content'][:5000]}")
-                        source_sections.append("")
+                        _emit(f"[Fetched Page] URL: {content['url']}")
+                        _emit(f"Content: {content['content'][:5000]}")
+                        _emit("")
                     
                     # Add search snippets
                     for result in kpi_data.get("search_results", [])[:4]:
-                        source_sections.append(f"[Search Result] URL: {result['url']}")
-                        source_sections.append(f"Snippet: {result['snippet']}")
-                        source_sections.append("")
+                        _emit(f"[Search Result] URL: {result['url']}")
+                        _emit(f"Snippet: {result['snippet']}")
+                        _emit("")
         
         # PRIORITY 4: Official Website Search Results
         if search_data.get("official_website"):
-            source_sections.append("=== OFFICIAL COLLEGE WEBSITE - SEARCH SNIPPETS ===")
+            _emit("=== OFFICIAL COLLEGE WEBSITE - SEARCH SNIPPETS ===")
             for item in search_data["official_website"][:10]:
-                source_sections.append(f"Title: {item['title']}")
-                source_sections.append(f"URL: {item['url']}")
-                source_sections.append(f"Snippet: {item['snippet']}")
-                source_sections.append("")
+                _emit(f"Title: {item['title']}")
+                _emit(f"URL: {item['url']}")
+                _emit(f"Snippet: {item['snippet']}")
+                _emit("")
         
         # PRIORITY 5: NIRF Data
         if search_data.get("nirf"):
-            source_sections.append("=== NIRF DOCUMENTS (OFFICIAL RANKING DATA) ===")
+            _emit("=== NIRF DOCUMENTS (OFFICIAL RANKING DATA) ===")
             for item in search_data["nirf"][:8]:
-                source_sections.append(f"Title: {item['title']}")
-                source_sections.append(f"URL: {item['url']}")
-                source_sections.append(f"Data: {item['snippet']}")
-                source_sections.append("")
+                _emit(f"Title: {item['title']}")
+                _emit(f"URL: {item['url']}")
+                _emit(f"Data: {item['snippet']}")
+                _emit("")
         
         if search_data.get("naac"):
-            source_sections.append("=== NAAC DOCUMENTS (ACCREDITATION DATA) ===")
+            _emit("=== NAAC DOCUMENTS (ACCREDITATION DATA) ===")
             for item in search_data["naac"][:5]:
-                source_sections.append(f"Title: {item['title']}")
-                source_sections.append(f"URL: {item['url']}")
-                source_sections.append(f"Content: {item['snippet']}")
-                source_sections.append("")
+                _emit(f"Title: {item['title']}")
+                _emit(f"URL: {item['url']}")
+                _emit(f"Content: {item['snippet']}")
+                _emit("")
         
-        search_content = "\n".join(source_sections)
+        search_content = _content_buf.getvalue()
         
         # Limit content size for API - smart truncation
-        if len(search_content) > 120000:
-            search_content = search_content[:120000] + "\n[Content truncated for processing]"
-        
-        # Build KPI extraction instructions with search keywords hint
-        kpi_details = []
-        for i, kpi in enumerate(kpis_batch, 1):
-            detail = f"{i}. KPI: {kpi['name']}"
-            detail += f"\n   Category: {kpi['category']}"
-            detail += f"\n   Data Type: {kpi['data_type']} ({kpi['unit']})"
-            detail += f"\n   Extraction Rule: {kpi['extraction_instruction']}"
-            if kpi.get('search_keywords'):
-                detail += f"\n   Look for keywords: {', '.join(kpi['search_keywords'][:5])}"
-            kpi_details.append(detail)
+        if len(search_content) > _content_cap:
+            search_content = search_content[:_content_cap] + "\n[Content truncated for processing]"
         
-        kpi_list_str = "\n".join(kpi_details)
+        # Build KPI extraction instructions from the preformatted details
+        kpi_list_str = "\n".join(
+            f"{i}. {_KPI_DETAIL_CACHE.get(kpi['name']) or _format_kpi_detail(kpi)}"
+            for i, kpi in enumerate(kpis_batch, 1)
+        )
         
-        prompt = f"""You are an elite data extraction AI specializing in Indian educational institution KPIs. Your extraction accuracy directly impacts institutional rankings and decisions.
-
-INSTITUTION: "{college_name}"
-
-=== EXTRACTION PHILOSOPHY ===
-AGGRESSIVE EXTRACTION: Find data even from indirect mentions. "Data Not Found" is only acceptable if NO related information exists anywhere.
-
-=== ACCURACY REQUIREMENTS ===
-1. EXHAUSTIVE SEARCH: Read EVERY section of source data - data often appears in unexpected places
-2. EXACT EXTRACTION: Copy numbers, percentages, and values exactly as they appear
-3. SMART INFERENCE: Calculate derived values (e.g., percentage from ratio, total from sum of parts)
-4. BOOLEAN LOGIC:
-   - TRUE: Any mention of facility/feature existing (even partial)
-   - FALSE: Explicit statement of non-existence
-   - null: ONLY if topic never mentioned
-5. CONTEXT CLUES: Use related data to infer missing values
-6. PRIORITIZE SOURCES:
-   a) Public Disclosure PDFs (AICTE mandated - highest trust)
-   b) NIRF data (government verified)
-   c) Official website content
-   d) NAAC documents (accreditation verified)
-
-=== CONFIDENCE SCORING ===
-- "high": Direct quote with exact value from official document
-- "medium": Calculated/inferred value OR from search snippets
-- "low": Estimated from context OR partial data
-
-=== DATA TYPE STRATEGIES ===
-| Type | Extraction Strategy |
-|------|---------------------|
-| Integer | Look for: "X students", "total of X", statistics tables |
-| Boolean | Look for: mentions, descriptions, facility lists, infrastructure pages |
-| Array | Look for: lists, menus, program pages, department listings |
-| Float | Look for: percentages, CTCs, ratios, averages |
-| Object | Look for: fee structures, cutoffs, key-value data in tables |
+        prompt = f"""INSTITUTION: "{college_name}"
 
 === OFFICIAL SOURCE DATA (READ EVERY SECTION) ===
 {search_content}
@@ -1641,32 +2265,6 @@ AGGRESSIVE EXTRACTION: Find data even from indirect mentions. "Data Not Found" i
 {kpi_list_str}
 === END KPIs ===
 
-EXTRACTION EXAMPLES:
-Example 1 - Infrastructure:
-If source says "The college has smart classrooms with projectors and LMS system"
-→ ICT-Enabled Learning Infrastructure: true, confidence: high
-
-Example 2 - Numbers from context:
-If source says "We have 15 departments with an average of 50 faculty per department"
-→ Total Faculty: 750 (calculated: 15*50), confidence: medium
-
-Example 3 - Lists from descriptions:
-If source mentions "Our clubs include coding, robotics, music and drama societies"
-→ Active Clubs: ["Coding Club", "Robotics Club", "Music Society", "Drama Society"], confidence: high
-
-OUTPUT FORMAT - Return ONLY valid JSON array (no markdown, no explanation):
-[
-  {{
-    "kpi_name": "exact KPI name from list",
-    "category": "category from list",
-    "value": "extracted/derived value OR 'Data Not Found' only if truly absent",
-    "evidence_quote": "exact quote or calculation explanation",
-    "source_url": "URL where found OR 'N/A'",
-    "source_type": "Official College Website/NIRF/NAAC/AICTE/UGC/Public Disclosure/Derived",
-    "confidence": "high/medium/low"
-  }}
-]
-
 MANDATORY: Extract ALL {len(kpis_batch)} KPIs. Use inference and context clues. Return ONLY the JSON array now:"""
 
         # Define response schema for accurate KPI extraction
@@ -1688,16 +2286,18 @@ MANDATORY: Extract ALL {len(kpis_batch)} KPIs. Use inference and context clues.
         }
 
         try:
-            # Use modern google-genai client API with Gemini 3 Flash
-            response = client.models.generate_content(
+            # Use the SDK's native async surface with Gemini 3 Flash; the
+            # static instructions ride as the (cacheable) system prompt
+            response = await client.aio.models.generate_content(
                 model="gemini-3-flash-preview",
                 contents=prompt,
                 config=types.GenerateContentConfig(
+                    system_instruction=_EXTRACTION_SYSTEM_PROMPT,
                     temperature=0.4,  # 0.0 is optimal for extraction accuracy
                     response_mime_type="application/json",
                     response_schema=kpi_response_schema,  # Schema for accuracy
                     thinking_config=types.ThinkingConfig(thinking_budget=1024)  # Low thinking for speed
-                )
+                ),
             )
             
             text = response.text.strip()
@@ -1708,7 +2308,7 @@ MANDATORY: Extract ALL {len(kpis_batch)} KPIs. Use inference and context clues.
             elif "```" in text:
                 text = text.split("```")[1].split("```")[0]
             
-            results = json.loads(text.strip())
+            results = _json_loads(text.strip())
             
             # Validate sources - ensure only official sources are cited
             validated_results = []
@@ -1724,8 +2324,9 @@ MANDATORY: Extract ALL {len(kpis_batch)} KPIs. Use inference and context clues.
             
             # Fill missing KPIs
             found_kpis = {str(r.get('kpi_name', '')).lower().strip() for r in validated_results}
-            for kpi in kpis_batch:
-                if kpi['name'].lower().strip() not in found_kpis:
+            batch_names = {kpi['name'].lower().strip(): kpi for kpi in kpis_batch}
+            for name, kpi in batch_names.items():
+                if name not in found_kpis:
                     validated_results.append({
                         "kpi_name": kpi['name'],
                         "category": kpi['category'],
@@ -1740,12 +2341,9 @@ MANDATORY: Extract ALL {len(kpis_batch)} KPIs. Use inference and context clues.
             
         except json.JSONDecodeError as e:
             logger.error(f"JSON parse error: {e}")
-            try:
-                json_match = re.search(r'\[[\s\S]*\]', text)
-                if json_match:
-                    return json.loads(json_match.group())
-            except:
-                pass
+            salvaged = _salvage_json_array(text)
+            if salvaged is not None:
+                return salvaged
             
             return [
                 {
@@ -1905,26 +2503,54 @@ MANDATORY: Extract ALL {len(kpis_batch)} KPIs. Use inference and context clues.
         if progress_callback:
             await progress_callback(f"Found {total_sources} official sources. Extracting KPIs...", 90)
         
-        # Step 2: Extract KPIs in smaller batches for better accuracy (5 KPIs per batch)
-        all_results = []
+        # Step 2: Extract KPIs in smaller batches for better accuracy (5 KPIs per batch).
+        # Batches run concurrently under a semaphore so a slow Gemini call on
+        # one batch no longer stalls the others.
         batch_size = 5  # Smaller batches for better accuracy on each KPI
         total_kpis = len(self.kpis_data)
-        
-        for i in range(0, total_kpis, batch_size):
-            batch = self.kpis_data[i:i + batch_size]
-            batch_num = (i // batch_size) + 1
-            total_batches = (total_kpis + batch_size - 1) // batch_size
-            
+        batches = [self.kpis_data[i:i + batch_size] for i in range(0, total_kpis, batch_size)]
+        total_batches = len(batches)
+
+        if progress_callback:
+            await progress_callback(f"Extracting KPIs in {total_batches} concurrent batches...", 92)
+
+        extraction_sem = asyncio.Semaphore(3)
+
+        async def extract_batch(batch: List[Dict]) -> List[Dict]:
+            async with extraction_sem:
+                try:
+                    return await self.extract_kpi_with_strict_sources(
+                        college_name, batch, search_data, client
+                    )
+                except Exception as e:
+                    logger.error(f"Batch extraction failed: {e}")
+                    return [
+                        {
+                            "kpi_name": kpi['name'],
+                            "category": kpi['category'],
+                            "value": "Data Not Found",
+                            "evidence_quote": str(e),
+                            "source_url": "N/A",
+                            "source_type": "N/A",
+                            "confidence": "low"
+                        }
+                        for kpi in batch
+                    ]
+
+        # Consume batches as they finish so results accumulate incrementally
+        # and progress reflects actual completions, not launch order
+        tasks = [asyncio.create_task(extract_batch(batch)) for batch in batches]
+        all_results = []
+        completed_batches = 0
+        for next_done in asyncio.as_completed(tasks):
+            all_results.extend(await next_done)
+            completed_batches += 1
             if progress_callback:
-                progress = 90 + int(((i + batch_size) / total_kpis) * 9)
-                await progress_callback(f"Extracting KPIs batch {batch_num}/{total_batches}...", min(progress, 99))
-            
-            batch_results = await self.extract_kpi_with_strict_sources(
-                college_name, batch, search_data, client
-            )
-            all_results.extend(batch_results)
-            
-            await asyncio.sleep(0.05)  # Minimal delay between batches
+                progress = 90 + int((completed_batches / total_batches) * 9)
+                await progress_callback(
+                    f"Extracted KPI batch {completed_batches}/{total_batches}",
+                    min(progress, 99)
+                )
         
         # Step 3: Validate and boost confidence
         if progress_callback:
@@ -1938,62 +2564,108 @@ MANDATORY: Extract ALL {len(kpis_batch)} KPIs. Use inference and context clues.
         return all_results
 
 
-# Initialize auditor
-auditor = CollegeKPIAuditor()
+@functools.lru_cache(maxsize=1)
+def get_auditor() -> CollegeKPIAuditor:
+    """Process-wide auditor instance (shared HTTP pool, KPI list, validator)"""
+    return CollegeKPIAuditor()
 
 # ============ Background Task Processing ============
 
+# Sentinel values treated as "no data" - hoisted so the summary loop does a
+# frozenset membership test instead of rebuilding lists per call
+_MISSING_VALUES = frozenset({'data not found', 'error', 'processing error', 'not available', ''})
+_MISSING_VALUES_SOURCES = frozenset({'data not found', 'error', ''})
+_MISSING_VALUES_CATEGORIES = frozenset({'data not found', 'error', 'processing error', ''})
+
+
+def _generate_summary(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the audit summary in a single pass over results.
+
+    One loop updates all counters at once so each row's value is normalized
+    exactly once, instead of re-walking the list per statistic.
+    """
+    if not results:
+        # Common case for failed audits - skip the loop and dict setup
+        return {
+            "total_kpis": 0,
+            "data_found": 0,
+            "data_not_found": 0,
+            "high_confidence": 0,
+            "medium_confidence": 0,
+            "coverage_percentage": 0,
+            "sources_breakdown": {},
+            "categories": {}
+        }
+
+    total = len(results)
+    found = 0
+    high_conf = 0
+    medium_conf = 0
+    sources: Dict[str, int] = defaultdict(int)
+    categories: Dict[str, Dict[str, int]] = defaultdict(lambda: {'total': 0, 'found': 0})
+
+    for r in results:
+        val_lower = str(r.get('value', '')).lower()
+        conf = r.get('confidence')
+
+        if val_lower not in _MISSING_VALUES:
+            found += 1
+        if conf == 'high':
+            high_conf += 1
+        elif conf == 'medium':
+            medium_conf += 1
+
+        # Adding the bool keeps zero-hit sources visible with one hash probe
+        sources[r.get('source_type', 'N/A')] += val_lower not in _MISSING_VALUES_SOURCES
+
+        cat = categories[r.get('category', 'Other')]
+        cat['total'] += 1
+        if val_lower not in _MISSING_VALUES_CATEGORIES:
+            cat['found'] += 1
+
+    return {
+        "total_kpis": total,
+        "data_found": found,
+        "data_not_found": total - found,
+        "high_confidence": high_conf,
+        "medium_confidence": medium_conf,
+        "coverage_percentage": round((found / total) * 100, 1) if total > 0 else 0,
+        "sources_breakdown": dict(sources),
+        "categories": dict(categories)
+    }
+
+
+# Bound concurrent audits per process: each audit fans out dozens of
+# fetches and LLM calls, so running too many at once starves them all
+_audit_semaphore = asyncio.Semaphore(int(os.environ.get('MAX_CONCURRENT_AUDITS', '2')))
+
+
 async def process_audit(audit_id: str, college_name: str):
     """Background task to process audit"""
     try:
         institute_info = {}
         
+        if _audit_semaphore.locked() and audit_id in audits_store:
+            audits_store.update(audit_id, {
+                "progress_message": "Queued - waiting for a free audit slot..."
+            }, persist=False)
+        
         async def progress_callback(message: str, progress: int):
             if audit_id in audits_store:
-                audits_store[audit_id]["progress"] = progress
-                audits_store[audit_id]["progress_message"] = message
-        
-        results = await auditor.run_audit(college_name, progress_callback)
-        
-        # Generate summary
-        total = len(results)
-        found = sum(1 for r in results if str(r.get('value', '')).lower() not in 
-                   ['data not found', 'error', 'processing error', 'not available', ''])
-        high_conf = sum(1 for r in results if r.get('confidence') == 'high')
-        medium_conf = sum(1 for r in results if r.get('confidence') == 'medium')
-        
-        # Group by source type
-        sources = {}
-        for r in results:
-            src = r.get('source_type', 'N/A')
-            if src not in sources:
-                sources[src] = 0
-            if str(r.get('value', '')).lower() not in ['data not found', 'error', '']:
-                sources[src] += 1
-        
-        # Group by category
-        categories = {}
-        for r in results:
-            cat = r.get('category', 'Other')
-            if cat not in categories:
-                categories[cat] = {'total': 0, 'found': 0}
-            categories[cat]['total'] += 1
-            if str(r.get('value', '')).lower() not in ['data not found', 'error', 'processing error', '']:
-                categories[cat]['found'] += 1
-        
-        summary = {
-            "total_kpis": total,
-            "data_found": found,
-            "data_not_found": total - found,
-            "high_confidence": high_conf,
-            "medium_confidence": medium_conf,
-            "coverage_percentage": round((found / total) * 100, 1) if total > 0 else 0,
-            "sources_breakdown": sources,
-            "categories": categories
-        }
+                audits_store.update(audit_id, {
+                    "progress": progress,
+                    "progress_message": message
+                }, persist=False)
+                _notify_audit(audit_id)
+        
+        async with _audit_semaphore:
+            results = await get_auditor().run_audit(college_name, progress_callback)
+        
+        # Generate summary in one pass over the results
+        summary = _generate_summary(results)
         
         if audit_id in audits_store:
-            audits_store[audit_id].update({
+            audits_store.update(audit_id, {
                 "status": "completed",
                 "progress": 100,
                 "progress_message": "Audit complete!",
@@ -2002,14 +2674,16 @@ async def process_audit(audit_id: str, college_name: str):
                 "institute_info": institute_info,
                 "completed_at": datetime.now(timezone.utc).isoformat()
             })
+            _notify_audit(audit_id)
         
     except Exception as e:
         logger.error(f"Audit processing error: {e}")
         if audit_id in audits_store:
-            audits_store[audit_id].update({
+            audits_store.update(audit_id, {
                 "status": "failed",
                 "progress_message": f"Error: {str(e)}"
             })
+            _notify_audit(audit_id)
 
 
 # ============ API Routes ============
@@ -2023,7 +2697,7 @@ async def health_check():
     return {"status": "healthy", "timestamp": datetime.now(timezone.utc).isoformat()}
 
 @api_router.get("/kpis")
-async def get_kpis():
+async def get_kpis(auditor: CollegeKPIAuditor = Depends(get_auditor)):
     """Get all available KPIs"""
     return {
         "total": len(auditor.kpis_data),
@@ -2046,7 +2720,7 @@ async def get_allowed_sources():
 @api_router.post("/audit/start")
 async def start_audit(request: AuditRequest, background_tasks: BackgroundTasks):
     """Start a new college audit"""
-    audit_id = str(uuid.uuid4())
+    audit_id = uuid.uuid4().hex
     college_name = request.college_name.strip()
     
     if not college_name:
@@ -2065,6 +2739,7 @@ async def start_audit(request: AuditRequest, background_tasks: BackgroundTasks):
     }
     
     audits_store[audit_id] = audit_doc
+    audit_events[audit_id] = asyncio.Event()
     background_tasks.add_task(process_audit, audit_id, college_name)
     
     return {"audit_id": audit_id, "status": "processing", "message": f"Audit started for {college_name}"}
@@ -2094,22 +2769,40 @@ async def get_audit_status(audit_id: str):
 async def stream_audit_progress(audit_id: str):
     """Stream audit progress updates via SSE"""
     async def event_generator():
-        last_progress = -1
+        event = audit_events.get(audit_id)
         while True:
             audit = audits_store.get(audit_id)
             
             if not audit:
-                yield f"data: {json.dumps({'error': 'Audit not found'})}\n\n"
+                yield f"data: {_json_dumps({'error': 'Audit not found'})}\n\n"
                 break
             
-            if audit.get('progress', 0) != last_progress or audit.get('status') == 'completed':
-                last_progress = audit.get('progress', 0)
-                yield f"data: {json.dumps(audit)}\n\n"
-            
-            if audit.get('status') in ['completed', 'failed']:
+            # In-flight ticks carry only the progress delta; the heavy
+            # results/summary payload is serialized once, on the final event
+            status = audit.get('status')
+            if status in ('completed', 'failed'):
+                yield f"data: {_json_dumps(audit)}\n\n"
                 break
             
-            await asyncio.sleep(1)
+            payload = {
+                "id": audit.get("id", audit_id),
+                "status": status,
+                "progress": audit.get("progress", 0),
+                "progress_message": audit.get("progress_message", ""),
+            }
+            yield f"data: {_json_dumps(payload)}\n\n"
+            
+            if event is not None:
+                # Sleep until process_audit signals a change; the timeout is
+                # just an SSE keepalive, not a polling interval
+                try:
+                    await asyncio.wait_for(event.wait(), timeout=15)
+                except asyncio.TimeoutError:
+                    pass
+                event.clear()
+            else:
+                # Audit predates this process (reloaded from disk): no signal
+                await asyncio.sleep(1)
     
     return StreamingResponse(
         event_generator(),
@@ -2123,12 +2816,10 @@ async def stream_audit_progress(audit_id: str):
 @api_router.get("/audits")
 async def list_audits(limit: int = 20):
     """List recent audits"""
-    sorted_audits = sorted(
-        audits_store.values(),
-        key=lambda x: x.get('created_at', ''),
-        reverse=True
-    )[:limit]
-    return {"audits": sorted_audits, "count": len(sorted_audits)}
+    # The store keeps audits in creation order, so the newest ones are
+    # just the tail of the dict - no need to sort the whole thing
+    recent = list(itertools.islice(reversed(audits_store.values()), max(limit, 0)))
+    return {"audits": recent, "count": len(recent)}
 
 @api_router.delete("/audit/{audit_id}")
 async def delete_audit(audit_id: str):
@@ -2136,17 +2827,26 @@ async def delete_audit(audit_id: str):
     if audit_id not in audits_store:
         raise HTTPException(status_code=404, detail="Audit not found")
     del audits_store[audit_id]
+    audit_events.pop(audit_id, None)
     return {"message": "Audit deleted", "id": audit_id}
 
 
 # Include router
 app.include_router(api_router)
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_credentials=True,
-    allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+
+if __name__ == "__main__":
+    import importlib.util
+    import uvicorn
+    
+    # Prefer the C event loop / HTTP parser when installed
+    loop_impl = "uvloop" if importlib.util.find_spec("uvloop") else "auto"
+    http_impl = "httptools" if importlib.util.find_spec("httptools") else "auto"
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", 8000)),
+        loop=loop_impl,
+        http=http_impl,
+        log_level="info",
+    )